@@ -8,8 +8,8 @@ from typing import Optional
 from ground.hints import Point
 from reprit.base import generate_repr
 
-from .hints import SegmentEndpoints
-from .quad_edge import QuadEdge
+from .hints import (QuadEdgeLike,
+                    SegmentEndpoints)
 
 
 class Event(ABC):
@@ -97,7 +97,7 @@ class LeftEvent(Event):
                  right: Optional[RightEvent],
                  from_first: bool,
                  interior_to_left: bool,
-                 edge: Optional[QuadEdge] = None) -> None:
+                 edge: Optional[QuadEdgeLike] = None) -> None:
         self._from_first, self._right, self._start = from_first, right, start
         self.interior_to_left = interior_to_left
         self.edge = edge
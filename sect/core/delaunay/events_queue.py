@@ -13,8 +13,8 @@ from sect.core.hints import Orienteer
 from .event import (Event,
                     LeftEvent,
                     RightEvent)
-from .hints import SegmentEndpoints
-from .quad_edge import QuadEdge
+from .hints import (QuadEdgeLike,
+                    SegmentEndpoints)
 from .sweep_line import SweepLine
 
 
@@ -135,7 +135,7 @@ class EventsQueue:
         self._queue.push(event)
 
     def register_edge(self,
-                      edge: QuadEdge,
+                      edge: QuadEdgeLike,
                       *,
                       from_first: bool,
                       is_counterclockwise_contour: bool) -> None:
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import (Any,
+                    Iterable,
+                    Tuple,
+                    Type)
+
+from ground.base import (Context,
+                         Location,
+                         Orientation)
+from ground.hints import Point
+from reprit.base import generate_repr
+
+# relative error bounds of floating point orientation & in-circle
+# determinants by J. R. Shewchuk, see https://doi.org/10.1007/PL00009321
+IN_CIRCLE_ERROR_BOUND = (10. + 96. * 2. ** -53) * 2. ** -53
+ORIENTATION_ERROR_BOUND = (3. + 16. * 2. ** -53) * 2. ** -53
+
+
+class FilteredContext:
+    """
+    Represents geometric context which evaluates orientation
+    & point-in-circle tests in floating point arithmetic
+    and falls back to the wrapped context
+    only when the sign of a determinant is not certain,
+    other attributes are taken from the wrapped context.
+
+    Points' coordinates should be representable by floats,
+    they are converted to floats before evaluation,
+    so integral ones do not get multiplied as big integers.
+    """
+
+    __slots__ = 'context',
+
+    def __init__(self, context: Context) -> None:
+        self.context = context
+
+    __repr__ = generate_repr(__init__)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.context, name)
+
+    def __reduce__(self) -> Tuple[Type[FilteredContext], Tuple[Context]]:
+        return type(self), (self.context,)
+
+    def angle_orientation(self,
+                          vertex: Point,
+                          first_ray_point: Point,
+                          second_ray_point: Point) -> Orientation:
+        """
+        Returns orientation of angle with given vertex and ray points.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Point = context.point_cls
+        >>> filtered_context = FilteredContext(context)
+        >>> (filtered_context.angle_orientation(Point(0., 0.), Point(1., 0.),
+        ...                                     Point(0., 1.))
+        ...  is Orientation.COUNTERCLOCKWISE)
+        True
+        >>> (filtered_context.angle_orientation(Point(0., 0.), Point(1., 1.),
+        ...                                     Point(.1, .1))
+        ...  is Orientation.COLLINEAR)
+        True
+        """
+        vertex_x, vertex_y = float(vertex.x), float(vertex.y)
+        left = ((float(first_ray_point.x) - vertex_x)
+                * (float(second_ray_point.y) - vertex_y))
+        right = ((float(first_ray_point.y) - vertex_y)
+                 * (float(second_ray_point.x) - vertex_x))
+        determinant = left - right
+        error_bound = ORIENTATION_ERROR_BOUND * (abs(left) + abs(right))
+        if determinant > error_bound:
+            return Orientation.COUNTERCLOCKWISE
+        elif -determinant > error_bound:
+            return Orientation.CLOCKWISE
+        return self.context.angle_orientation(vertex, first_ray_point,
+                                              second_ray_point)
+
+    def locate_point_in_point_point_point_circle(self,
+                                                 point: Point,
+                                                 first: Point,
+                                                 second: Point,
+                                                 third: Point) -> Location:
+        """
+        Returns location of point relative to the circle
+        passing through given points,
+        which is inverted for clockwise oriented points.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Point = context.point_cls
+        >>> filtered_context = FilteredContext(context)
+        >>> (filtered_context.locate_point_in_point_point_point_circle(
+        ...      Point(.5, .4), Point(0., 0.), Point(1., 0.), Point(0., 1.)
+        ...  )
+        ...  is Location.INTERIOR)
+        True
+        >>> (filtered_context.locate_point_in_point_point_point_circle(
+        ...      Point(1., 1.), Point(0., 0.), Point(1., 0.), Point(0., 1.)
+        ...  )
+        ...  is Location.BOUNDARY)
+        True
+        """
+        point_x, point_y = float(point.x), float(point.y)
+        first_dx, first_dy = (float(first.x) - point_x,
+                              float(first.y) - point_y)
+        second_dx, second_dy = (float(second.x) - point_x,
+                                float(second.y) - point_y)
+        third_dx, third_dy = (float(third.x) - point_x,
+                              float(third.y) - point_y)
+        first_lift = first_dx * first_dx + first_dy * first_dy
+        second_lift = second_dx * second_dx + second_dy * second_dy
+        third_lift = third_dx * third_dx + third_dy * third_dy
+        second_third_left, second_third_right = (second_dx * third_dy,
+                                                 second_dy * third_dx)
+        third_first_left, third_first_right = (third_dx * first_dy,
+                                               third_dy * first_dx)
+        first_second_left, first_second_right = (first_dx * second_dy,
+                                                 first_dy * second_dx)
+        determinant = (
+                first_lift * (second_third_left - second_third_right)
+                + second_lift * (third_first_left - third_first_right)
+                + third_lift * (first_second_left - first_second_right)
+        )
+        error_bound = IN_CIRCLE_ERROR_BOUND * (
+                first_lift * (abs(second_third_left)
+                              + abs(second_third_right))
+                + second_lift * (abs(third_first_left)
+                                 + abs(third_first_right))
+                + third_lift * (abs(first_second_left)
+                                + abs(first_second_right))
+        )
+        if determinant > error_bound:
+            return Location.INTERIOR
+        elif -determinant > error_bound:
+            return Location.EXTERIOR
+        return self.context.locate_point_in_point_point_point_circle(
+                point, first, second, third
+        )
+
+
+def are_coordinates_representable_by_floats(points: Iterable[Point]
+                                            ) -> bool:
+    try:
+        return all(float(point.x) == point.x and float(point.y) == point.y
+                   for point in points)
+    except OverflowError:
+        return False
@@ -1,11 +1,76 @@
 from typing import (Callable,
+                    Dict,
                     Tuple)
 
-from ground.base import (Location,
+import typing_extensions as _te
+from ground.base import (Context,
+                         Location,
+                         Orientation,
                          Relation)
 from ground.hints import (Point,
                           Segment)
 
+
+class QuadEdgeLike(_te.Protocol):
+    """
+    Interface shared by separate quad-edges & the ones from the store.
+    """
+
+    @property
+    def context(self) -> Context:
+        ...
+
+    @property
+    def end(self) -> Point:
+        ...
+
+    @property
+    def left_from_end(self) -> _te.Self:
+        ...
+
+    @property
+    def left_from_start(self) -> _te.Self:
+        ...
+
+    @property
+    def opposite(self) -> _te.Self:
+        ...
+
+    @property
+    def right_from_end(self) -> _te.Self:
+        ...
+
+    @property
+    def right_from_start(self) -> _te.Self:
+        ...
+
+    @property
+    def rotated(self) -> _te.Self:
+        ...
+
+    @property
+    def start(self) -> Point:
+        ...
+
+    def connect(self, other: _te.Self) -> _te.Self:
+        ...
+
+    def delete(self) -> None:
+        ...
+
+    def orientation_of(self, point: Point) -> Orientation:
+        ...
+
+    def splice(self, other: _te.Self) -> None:
+        ...
+
+    def swap(self) -> None:
+        ...
+
+
+EdgeFactory = Callable[[Point, Point], QuadEdgeLike]
+# insertion-ordered, so processing order does not depend on edges' hashes
+OrderedEdges = Dict[QuadEdgeLike, None]
 PointInCircleLocator = Callable[[Point, Point, Point, Point], Location]
 SegmentEndpoints = Tuple[Point, Point]
 SegmentContainmentChecker = Callable[[Segment, Point], bool]
@@ -0,0 +1,65 @@
+from array import array
+from typing import (Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
+from ground.base import Context
+from ground.hints import Point
+
+from .hints import QuadEdgeLike
+from .quad_edge import quad_edges_from_links
+from .quad_edges_store import (QuadEdgesStore,
+                               StoredQuadEdge)
+
+RawQuadEdges = Tuple['array[int]', 'array[int]', int, int]
+
+
+def pack_quad_edges(edges: Iterable[QuadEdgeLike],
+                    left_side: QuadEdgeLike,
+                    right_side: QuadEdgeLike,
+                    points_indices: Dict[Point, int]) -> RawQuadEdges:
+    """
+    Packs edges (one per pair with opposites)
+    into flat arrays of "Onext" links
+    & indices of starts of primal quarter-edges in given points
+    with quarter-edges of an edge at consecutive indices
+    along with packed indices of sides.
+    """
+    quarters: List[QuadEdgeLike] = []
+    for edge in edges:
+        quarter = edge
+        for _ in range(4):
+            quarters.append(quarter)
+            quarter = quarter.rotated
+    quarters_indices = {quarter: index
+                        for index, quarter in enumerate(quarters)}
+    left_from_start = array('I', [quarters_indices[quarter.left_from_start]
+                                  for quarter in quarters])
+    starts = array('I', [points_indices[quarter.start]
+                         for quarter in quarters[::2]])
+    return (left_from_start, starts, quarters_indices[left_side],
+            quarters_indices[right_side])
+
+
+def unpack_quad_edges(
+        raw: RawQuadEdges,
+        points: Sequence[Point],
+        store: Optional[QuadEdgesStore],
+        context: Context
+) -> Tuple[QuadEdgeLike, QuadEdgeLike]:
+    """
+    Restores edges from flat arrays produced by ``pack_quad_edges``
+    into the store (or as separate objects if it is not given)
+    and returns sides.
+    """
+    left_from_start, starts_indices, left_index, right_index = raw
+    starts = [points[index] for index in starts_indices]
+    if store is None:
+        quarters = quad_edges_from_links(left_from_start, starts, context)
+        return quarters[left_index], quarters[right_index]
+    offset = store.extend(left_from_start, starts)
+    return (StoredQuadEdge(store, offset + left_index),
+            StoredQuadEdge(store, offset + right_index))
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from typing import (Iterable,
                     List,
-                    Optional)
+                    Optional,
+                    Sequence)
 
 from ground.base import (Context,
                          Orientation)
 from ground.hints import Point
 from reprit.base import generate_repr
 
+from .hints import QuadEdgeLike
+
 
 class QuadEdge:
     """
@@ -164,18 +167,37 @@ class QuadEdge:
         opposite._start = opposite_side.end
 
 
-def edge_to_neighbours(edge: QuadEdge) -> List[QuadEdge]:
+def edge_to_neighbours(edge: QuadEdgeLike) -> List[QuadEdgeLike]:
     return (list(_edge_to_incidents(edge))
             + list(_edge_to_incidents(edge.opposite)))
 
 
-def edges_with_opposites(edges: Iterable[QuadEdge]) -> Iterable[QuadEdge]:
+def edges_with_opposites(
+        edges: Iterable[QuadEdgeLike]
+) -> Iterable[QuadEdgeLike]:
     for edge in edges:
         yield edge
         yield edge.opposite
 
 
-def _edge_to_incidents(edge: QuadEdge) -> Iterable[QuadEdge]:
+def quad_edges_from_links(left_from_start: Sequence[int],
+                          starts: Sequence[Point],
+                          context: Context) -> List[QuadEdge]:
+    """
+    Creates quarter-edges with given "Onext" links
+    & starts of primal quarter-edges
+    indexed like in ``QuadEdgesStore``.
+    """
+    result = [QuadEdge(None if index & 1 else starts[index >> 1],
+                       context=context)
+              for index in range(len(left_from_start))]
+    for index, quarter in enumerate(result):
+        quarter._left_from_start = result[left_from_start[index]]
+        quarter._rotated = result[(index & ~3) | ((index + 1) & 3)]
+    return result
+
+
+def _edge_to_incidents(edge: QuadEdgeLike) -> Iterable[QuadEdgeLike]:
     if (edge.orientation_of(edge.right_from_start.end)
             is Orientation.CLOCKWISE):
         yield edge.right_from_start
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from array import array
+from typing import (Any,
+                    List,
+                    Sequence,
+                    Set)
+
+from ground.base import (Context,
+                         Orientation)
+from ground.hints import Point
+from reprit.base import generate_repr
+
+
+class QuadEdgesStore:
+    """
+    Represents storage of quad-edges in flat arrays.
+
+    Quarter-edges of an edge occupy four consecutive indices
+    starting from a multiple of four,
+    so "Rot" & "Sym" are computed arithmetically
+    and only "Onext" links & starts of primal quarter-edges are stored.
+    Slots of deleted edges are kept isolated
+    and reused by the next created edges.
+
+    Reference:
+        https://en.wikipedia.org/wiki/Quad-edge
+        http://www.sccg.sk/~samuelcik/dgs/quad_edge.pdf
+    """
+
+    __slots__ = 'context', '_free_indices', '_left_from_start', '_starts'
+
+    def __init__(self, context: Context) -> None:
+        self.context = context
+        self._free_indices: Set[int] = set()
+        self._left_from_start = array('I')
+        self._starts: List[Point] = []
+
+    __repr__ = generate_repr(__init__)
+
+    def __len__(self) -> int:
+        """Returns number of alive edges."""
+        return len(self._left_from_start) // 4 - len(self._free_indices)
+
+    def create_edge(self, start: Point, end: Point) -> StoredQuadEdge:
+        """Creates new edge from endpoints."""
+        left_from_start = self._left_from_start
+        if not self._free_indices:
+            index = len(left_from_start)
+            left_from_start.extend((index, index + 3, index + 2, index + 1))
+            self._starts.extend((start, end))
+        else:
+            index = self._free_indices.pop()
+            left_from_start[index:index + 4] = array(
+                    'I', (index, index + 3, index + 2, index + 1)
+            )
+            self._starts[index >> 1], self._starts[(index >> 1) + 1] = (
+                start, end
+            )
+        return StoredQuadEdge(self, index)
+
+    def extend(self,
+               left_from_start: Sequence[int],
+               starts: Sequence[Point]) -> int:
+        """
+        Appends edges with given "Onext" links
+        relative to the first appended quarter-edge
+        & starts of primal quarter-edges,
+        returns index of the first appended quarter-edge.
+        """
+        offset = len(self._left_from_start)
+        self._left_from_start.extend(offset + index
+                                     for index in left_from_start)
+        self._starts.extend(starts)
+        return offset
+
+    def _release(self, index: int) -> None:
+        self._free_indices.add(index)
+
+
+class StoredQuadEdge:
+    """
+    Represents quarter-edge from the store
+    with the same interface as ``QuadEdge``.
+    """
+
+    @property
+    def context(self) -> Context:
+        return self.store.context
+
+    @property
+    def end(self) -> Point:
+        """
+        aka "Dest" in L. Guibas and J. Stolfi notation.
+        """
+        return self.store._starts[(self.index ^ 2) >> 1]
+
+    @property
+    def left_from_end(self) -> StoredQuadEdge:
+        """
+        aka "Lnext" in L. Guibas and J. Stolfi notation.
+        """
+        index = self.store._left_from_start[_to_inverse_rotated(self.index)]
+        return StoredQuadEdge(self.store, _to_rotated(index))
+
+    @property
+    def left_from_start(self) -> StoredQuadEdge:
+        """
+        aka "Onext" in L. Guibas and J. Stolfi notation.
+        """
+        return StoredQuadEdge(self.store,
+                              self.store._left_from_start[self.index])
+
+    @property
+    def opposite(self) -> StoredQuadEdge:
+        """
+        aka "Sym" in L. Guibas and J. Stolfi notation.
+        """
+        return StoredQuadEdge(self.store, self.index ^ 2)
+
+    @property
+    def right_from_end(self) -> StoredQuadEdge:
+        """
+        aka "Rprev" in L. Guibas and J. Stolfi notation.
+        """
+        return StoredQuadEdge(self.store,
+                              self.store._left_from_start[self.index ^ 2])
+
+    @property
+    def right_from_start(self) -> StoredQuadEdge:
+        """
+        aka "Oprev" in L. Guibas and J. Stolfi notation.
+        """
+        index = self.store._left_from_start[_to_rotated(self.index)]
+        return StoredQuadEdge(self.store, _to_rotated(index))
+
+    @property
+    def rotated(self) -> StoredQuadEdge:
+        """
+        aka "Rot" in L. Guibas and J. Stolfi notation.
+        """
+        return StoredQuadEdge(self.store, _to_rotated(self.index))
+
+    @property
+    def start(self) -> Point:
+        """
+        aka "Org" in L. Guibas and J. Stolfi notation.
+        """
+        assert not self.index & 1, 'Dual edges have no start.'
+        return self.store._starts[self.index >> 1]
+
+    __slots__ = 'index', 'store'
+
+    def __init__(self, store: QuadEdgesStore, index: int) -> None:
+        self.index, self.store = index, store
+
+    __repr__ = generate_repr(__init__)
+
+    def __eq__(self, other: Any) -> Any:
+        return (self.index == other.index and self.store is other.store
+                if isinstance(other, StoredQuadEdge)
+                else NotImplemented)
+
+    def __hash__(self) -> int:
+        return self.index
+
+    def connect(self, other: StoredQuadEdge) -> StoredQuadEdge:
+        """Connects the edge with the other."""
+        result = self.store.create_edge(self.end, other.start)
+        result.splice(self.left_from_end)
+        result.opposite.splice(other)
+        return result
+
+    def delete(self) -> None:
+        """Deletes the edge."""
+        if self.index & ~3 in self.store._free_indices:
+            return
+        self.splice(self.right_from_start)
+        self.opposite.splice(self.opposite.right_from_start)
+        self.store._release(self.index & ~3)
+
+    def orientation_of(self, point: Point) -> Orientation:
+        """Returns orientation of the point relative to the edge."""
+        return self.context.angle_orientation(self.start, self.end, point)
+
+    def splice(self, other: StoredQuadEdge) -> None:
+        """Splices the edge with the other."""
+        left_from_start = self.store._left_from_start
+        index, other_index = self.index, other.index
+        alpha = _to_rotated(left_from_start[index])
+        beta = _to_rotated(left_from_start[other_index])
+        left_from_start[index], left_from_start[other_index] = (
+            left_from_start[other_index], left_from_start[index]
+        )
+        left_from_start[alpha], left_from_start[beta] = (
+            left_from_start[beta], left_from_start[alpha]
+        )
+
+    def swap(self) -> None:
+        """
+        Swaps diagonal in a quadrilateral formed by triangles
+        in both clockwise and counterclockwise order around the start.
+        """
+        side = self.right_from_start
+        opposite = self.opposite
+        opposite_side = opposite.right_from_start
+        self.splice(side)
+        opposite.splice(opposite_side)
+        self.splice(side.left_from_end)
+        opposite.splice(opposite_side.left_from_end)
+        starts = self.store._starts
+        starts[self.index >> 1] = side.end
+        starts[opposite.index >> 1] = opposite_side.end
+
+
+def _to_inverse_rotated(index: int) -> int:
+    return (index & ~3) | ((index + 3) & 3)
+
+
+def _to_rotated(index: int) -> int:
+    return (index & ~3) | ((index + 1) & 3)
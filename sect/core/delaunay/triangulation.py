@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import typing as _t
+from array import array
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 from itertools import (accumulate,
                        chain,
@@ -21,11 +23,20 @@ from reprit.base import generate_repr
 from sect.core.utils import (flatten,
                              pairwise)
 from .events_queue import EventsQueue
-from .hints import (PointInCircleLocator,
+from .filtered_context import (FilteredContext,
+                               are_coordinates_representable_by_floats)
+from .hints import (EdgeFactory,
+                    OrderedEdges,
+                    PointInCircleLocator,
+                    QuadEdgeLike,
                     SegmentsRelater)
+from .packing import (RawQuadEdges,
+                      pack_quad_edges,
+                      unpack_quad_edges)
 from .quad_edge import (QuadEdge,
                         edge_to_neighbours,
                         edges_with_opposites)
+from .quad_edges_store import QuadEdgesStore
 from .utils import (ceil_log2,
                     complete_vertices,
                     contour_to_oriented_edges_endpoints,
@@ -43,6 +54,9 @@ class Triangulation:
                              *,
                              extra_constraints: _t.Sequence[Segment] = (),
                              extra_points: _t.Sequence[Point] = (),
+                             compact: bool = False,
+                             filtered: bool = False,
+                             workers: int = 1,
                              context: Context) -> Triangulation:
         """
         Constructs constrained Delaunay triangulation of given polygon
@@ -86,12 +100,24 @@ class Triangulation:
             additional points to be presented in the triangulation.
         :param extra_constraints:
             additional constraints to be presented in the triangulation.
+        :param compact:
+            flag which specifies whether to keep edges
+            in flat arrays of ``QuadEdgesStore``.
+        :param filtered:
+            flag which specifies whether to evaluate predicates
+            in floating point arithmetic with exact fallback.
+        :param workers:
+            number of processes for Delaunay triangulation of vertices.
         :param context: geometric context.
         :returns:
             triangulation of the border, holes & extra points
             considering constraints.
         """
         border, holes = polygon.border, polygon.holes
+        # recorded before completion which reorders extra points
+        vertices = tuple(chain(border.vertices,
+                               flatten(hole.vertices for hole in holes),
+                               extra_points))
         if extra_points:
             border, holes, extra_points = complete_vertices(
                     border, holes, extra_points, context
@@ -100,7 +126,11 @@ class Triangulation:
                                          flatten(hole.vertices
                                                  for hole in holes),
                                          extra_points)),
+                              compact=compact,
+                              filtered=filtered,
+                              workers=workers,
                               context=context)
+        result._vertices = vertices
         border_edges = context.contour_segments(border)
         constrain(result, chain(border_edges,
                                 flatten(map(context.contour_segments, holes)),
@@ -118,6 +148,9 @@ class Triangulation:
     def delaunay(cls,
                  points: _t.Sequence[Point],
                  *,
+                 compact: bool = False,
+                 filtered: bool = False,
+                 workers: int = 1,
                  context: Context) -> Triangulation:
         """
         Constructs Delaunay triangulation of given points.
@@ -132,41 +165,130 @@ class Triangulation:
             http://www.sccg.sk/~samuelcik/dgs/quad_edge.pdf
 
         :param points: 3 or more points to triangulate.
+        :param compact:
+            flag which specifies whether to keep edges
+            in flat arrays of ``QuadEdgesStore``
+            instead of separate ``QuadEdge`` objects,
+            which takes several times less memory.
+        :param filtered:
+            flag which specifies whether to evaluate orientation
+            & point-in-circle tests in floating point arithmetic
+            falling back to the context
+            only when their results are not certain,
+            has effect only for points
+            with coordinates representable by floats.
+        :param workers:
+            number of processes which triangulate lower levels
+            of the merge tree, the rest of merges are done
+            in the current process.
         :param context: geometric context.
         :returns: triangulation of the points.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point = context.contour_cls, context.point_cls
+        >>> triangulation = Triangulation.delaunay(
+        ...     [Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)],
+        ...     compact=True,
+        ...     context=context
+        ... )
+        >>> len(triangulation.triangles())
+        2
         """
-        points = sorted(to_distinct(points))
-        lengths = coin_change(len(points), base_cases)
-        result = [cls._initialize_triangulation(points[start:stop], context)
-                  for start, stop in pairwise(accumulate((0,) + lengths))]
-        for _ in repeat(None, ceil_log2(len(result))):
-            parts_to_merge_count = len(result) // 2 * 2
-            result = ([merge(result[offset], result[offset + 1])
-                       for offset in range(0, parts_to_merge_count, 2)]
-                      + result[parts_to_merge_count:])
-        return result[0]
+        sorted_points = sorted(to_distinct(points))
+        # filtered predicates are used only during construction
+        construction_context = (
+            FilteredContext(context)
+            if (filtered
+                and are_coordinates_representable_by_floats(sorted_points))
+            else context
+        )
+        store = QuadEdgesStore(construction_context) if compact else None
+        lengths = coin_change(len(sorted_points), base_cases)
+        assert workers > 0, 'Workers count should be positive.'
+        # each of the workers merges parts from aligned groups
+        # in the same order as it would be done in a single process
+        workers_rounds_count = (max(ceil_log2(len(lengths))
+                                    - ceil_log2(workers), 0)
+                                if workers > 1
+                                else 0)
+        if workers_rounds_count:
+            parts = triangulate_parts_in_parallel(
+                    cls, sorted_points, lengths, workers_rounds_count,
+                    workers, store, construction_context
+            )
+        else:
+            edge_factory: EdgeFactory = (
+                store.create_edge
+                if store is not None
+                else partial(QuadEdge.from_endpoints,
+                             context=construction_context)
+            )
+            parts = triangulate_parts(cls, sorted_points, lengths,
+                                      edge_factory, construction_context)
+        result = merge_triangulations(parts)
+        result.context = context
+        result._vertices = tuple(points)
+        return result
 
     __slots__ = ('context', 'left_side', 'right_side',
-                 '_triangular_holes_vertices')
+                 '_triangular_holes_vertices', '_vertices')
 
     def __init__(self,
-                 left_side: QuadEdge,
-                 right_side: QuadEdge,
+                 left_side: QuadEdgeLike,
+                 right_side: QuadEdgeLike,
                  context: Context) -> None:
         self.context, self.left_side, self.right_side = (context, left_side,
                                                          right_side)
         self._triangular_holes_vertices: _t.Set[_t.FrozenSet[Point]] = set()
+        self._vertices: _t.Sequence[Point] = ()
 
     __repr__ = generate_repr(__init__)
 
-    def delete(self, edge: QuadEdge) -> None:
+    def delete(self, edge: QuadEdgeLike) -> None:
         """Deletes given edge from the triangulation."""
-        if edge is self.right_side or edge.opposite is self.right_side:
+        if edge == self.right_side or edge.opposite == self.right_side:
             self.right_side = self.right_side.right_from_end.opposite
-        if edge is self.left_side or edge.opposite is self.left_side:
+        if edge == self.left_side or edge.opposite == self.left_side:
             self.left_side = self.left_side.left_from_start
         edge.delete()
 
+    def iter_triangles(self) -> _t.Iterator[Contour]:
+        """
+        Returns iterator over triangles of the triangulation,
+        each of them is yielded once
+        with vertices in counterclockwise order
+        starting from the smallest one.
+
+        Unlike ``Triangulation.triangles`` does not keep visited triangles,
+        so their order may differ from the one of the latter.
+
+        Time complexity:
+            ``O(vertices_count)``
+        Memory complexity:
+            ``O(vertices_count)`` for marks of visited edges,
+            ``O(1)`` otherwise
+
+        where ``vertices_count`` is the number of triangulation vertices.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point = context.contour_cls, context.point_cls
+        >>> triangulation = Triangulation.delaunay(
+        ...     [Point(0, 0), Point(4, 0), Point(3, 3), Point(0, 1)],
+        ...     context=context
+        ... )
+        >>> triangles = triangulation.iter_triangles()
+        >>> sorted(triangles, key=lambda triangle: triangle.vertices) == [
+        ...     Contour([Point(0, 0), Point(4, 0), Point(0, 1)]),
+        ...     Contour([Point(0, 1), Point(4, 0), Point(3, 3)])
+        ... ]
+        True
+        """
+        contour_cls = self.context.contour_cls
+        for vertices in to_triangles_vertices(self):
+            yield contour_cls(list(vertices))
+
     def triangles(self) -> _t.List[Contour]:
         """Returns triangles of the triangulation."""
         vertices_sets = to_distinct(
@@ -184,29 +306,82 @@ class Triangulation:
                 for vertices in vertices_sets
                 if vertices not in self._triangular_holes_vertices]
 
+    def triangles_indices(self) -> _t.Tuple[_t.List[Point], array[int]]:
+        """
+        Returns vertices of the triangulation
+        with flat array of triangles' vertices indices,
+        three per triangle in counterclockwise order.
+
+        Vertices start with the points passed on construction
+        in the same order (with duplicates kept),
+        so indices refer to the first occurrences of points,
+        for constrained Delaunay triangulation these are
+        border's vertices followed by holes' vertices & extra points.
+
+        Time complexity:
+            ``O(vertices_count)``
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where ``vertices_count`` is the number of triangulation vertices.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Point = context.point_cls
+        >>> triangulation = Triangulation.delaunay(
+        ...     [Point(0, 0), Point(4, 0), Point(3, 3), Point(0, 1)],
+        ...     context=context
+        ... )
+        >>> vertices, indices = triangulation.triangles_indices()
+        >>> vertices == [Point(0, 0), Point(4, 0), Point(3, 3), Point(0, 1)]
+        True
+        >>> sorted(tuple(indices[offset:offset + 3])
+        ...        for offset in range(0, len(indices), 3))
+        [(0, 1, 3), (3, 1, 2)]
+        """
+        vertices = list(self._vertices)
+        vertices_indices: _t.Dict[Point, int] = {}
+        for index, vertex in enumerate(vertices):
+            vertices_indices.setdefault(vertex, index)
+        result = array('I')
+        for triangle_vertices in to_triangles_vertices(self):
+            for vertex in triangle_vertices:
+                try:
+                    result.append(vertices_indices[vertex])
+                except KeyError:
+                    vertices_indices[vertex] = len(vertices)
+                    result.append(len(vertices))
+                    vertices.append(vertex)
+        return vertices, result
+
     @classmethod
     def _initialize_triangulation(cls,
                                   points: _t.Sequence[Point],
+                                  edge_factory: EdgeFactory,
                                   context: Context) -> Triangulation:
-        return base_cases[len(points)](cls, points, context)
+        return base_cases[len(points)](cls, points, edge_factory, context)
 
 
 def bound(triangulation: Triangulation,
           border_edges: _t.Sequence[Segment]) -> None:
     border_endpoints = {to_endpoints(edge) for edge in border_edges}
-    non_boundary = {edge
-                    for edge in to_unique_boundary_edges(triangulation)
-                    if to_endpoints(edge) not in border_endpoints}
+    non_boundary = dict.fromkeys(
+            edge
+            for edge in to_unique_boundary_edges(triangulation)
+            if to_endpoints(edge) not in border_endpoints
+    )
     while non_boundary:
-        edge = non_boundary.pop()
+        edge, _ = non_boundary.popitem()
         candidates = edge_to_neighbours(edge)
         triangulation.delete(edge)
-        non_boundary.update(candidate
-                            for candidate in candidates
-                            if to_endpoints(candidate) not in border_endpoints)
+        non_boundary.update(dict.fromkeys(
+                candidate
+                for candidate in candidates
+                if to_endpoints(candidate) not in border_endpoints
+        ))
 
 
-def connect(base_edge: QuadEdge,
+def connect(base_edge: QuadEdgeLike,
             point_in_circle_locator: PointInCircleLocator) -> None:
     while True:
         left_candidate, right_candidate = (
@@ -232,35 +407,40 @@ def constrain(triangulation: Triangulation,
               constraints: _t.Iterable[Segment]) -> None:
     endpoints = {to_endpoints(edge) for edge in to_edges(triangulation)}
     inner_edges = to_unique_inner_edges(triangulation)
+    # edges keep the context they were constructed with
+    context = triangulation.left_side.context
     point_in_circle_locator, segments_relater = (
-        triangulation.context.locate_point_in_point_point_point_circle,
-        triangulation.context.segments_relation
+        context.locate_point_in_point_point_point_circle,
+        context.segments_relation
     )
     for constraint in constraints:
         constraint_endpoints = to_endpoints(constraint)
         if constraint_endpoints in endpoints:
             continue
         crossings = detect_crossings(inner_edges, constraint, segments_relater)
-        inner_edges.difference_update(crossings)
+        for edge in crossings:
+            del inner_edges[edge]
         endpoints.difference_update(to_endpoints(edge) for edge in crossings)
         new_edges = resolve_crossings(crossings, constraint, segments_relater)
-        set_criterion({edge
-                       for edge in new_edges
-                       if to_endpoints(edge) != constraint_endpoints},
+        set_criterion(dict.fromkeys(edge
+                                    for edge in new_edges
+                                    if to_endpoints(edge)
+                                    != constraint_endpoints),
                       point_in_circle_locator)
         endpoints.update(to_endpoints(edge) for edge in new_edges)
-        inner_edges.update(new_edges)
+        inner_edges.update(dict.fromkeys(new_edges))
 
 
 def cut(triangulation: Triangulation, holes: _t.Sequence[Contour]) -> None:
     if not holes:
         return
-    events_queue = EventsQueue(triangulation.context)
+    context = triangulation.left_side.context
+    events_queue = EventsQueue(context)
     for edge in to_unique_inner_edges(triangulation):
         events_queue.register_edge(edge,
                                    from_first=True,
                                    is_counterclockwise_contour=True)
-    orienteer = triangulation.context.angle_orientation
+    orienteer = context.angle_orientation
     for hole in holes:
         for endpoints in contour_to_oriented_edges_endpoints(
                 hole,
@@ -277,16 +457,18 @@ def cut(triangulation: Triangulation, holes: _t.Sequence[Contour]) -> None:
             triangulation.delete(event_edge)
 
 
-def detect_crossings(inner_edges: _t.Iterable[QuadEdge],
-                     constraint: Segment,
-                     segments_relater: SegmentsRelater) -> _t.List[QuadEdge]:
+def detect_crossings(
+        inner_edges: _t.Iterable[QuadEdgeLike],
+        constraint: Segment,
+        segments_relater: SegmentsRelater
+) -> _t.List[QuadEdgeLike]:
     return [edge
             for edge in inner_edges
             if segments_relater(edge, constraint) is Relation.CROSS]
 
 
 def edge_should_be_swapped(
-        edge: QuadEdge, point_in_circle_locator: PointInCircleLocator
+        edge: QuadEdgeLike, point_in_circle_locator: PointInCircleLocator
 ) -> bool:
     return (is_convex_quadrilateral_diagonal(edge)
             and (point_in_circle_locator(edge.right_from_start.end,
@@ -299,7 +481,8 @@ def edge_should_be_swapped(
                      is Location.INTERIOR)))
 
 
-def find_base_edge(first: Triangulation, second: Triangulation) -> QuadEdge:
+def find_base_edge(first: Triangulation,
+                   second: Triangulation) -> QuadEdgeLike:
     while True:
         if (first.right_side.orientation_of(second.left_side.start)
                 is Orientation.COUNTERCLOCKWISE):
@@ -317,7 +500,7 @@ def find_base_edge(first: Triangulation, second: Triangulation) -> QuadEdge:
     return base_edge
 
 
-def is_convex_quadrilateral_diagonal(edge: QuadEdge) -> bool:
+def is_convex_quadrilateral_diagonal(edge: QuadEdgeLike) -> bool:
     return (edge.right_from_start.orientation_of(edge.end)
             is Orientation.COUNTERCLOCKWISE
             is edge.right_from_end.opposite.orientation_of(
@@ -329,15 +512,26 @@ def is_convex_quadrilateral_diagonal(edge: QuadEdge) -> bool:
             ))
 
 
+def merge_triangulations(parts: _t.List[Triangulation]) -> Triangulation:
+    for _ in repeat(None, ceil_log2(len(parts))):
+        parts_to_merge_count = len(parts) // 2 * 2
+        parts = ([merge(parts[offset], parts[offset + 1])
+                  for offset in range(0, parts_to_merge_count, 2)]
+                 + parts[parts_to_merge_count:])
+    return parts[0]
+
+
 def merge(first: Triangulation, second: Triangulation) -> Triangulation:
     connect(find_base_edge(first, second),
             first.context.locate_point_in_point_point_point_circle)
     return type(first)(first.left_side, second.right_side, first.context)
 
 
-def resolve_crossings(crossings: _t.List[QuadEdge],
-                      constraint: Segment,
-                      segments_relater: SegmentsRelater) -> _t.List[QuadEdge]:
+def resolve_crossings(
+        crossings: _t.List[QuadEdgeLike],
+        constraint: Segment,
+        segments_relater: SegmentsRelater
+) -> _t.List[QuadEdgeLike]:
     result = []
     crossings_queue = deque(crossings,
                             maxlen=len(crossings))
@@ -354,32 +548,48 @@ def resolve_crossings(crossings: _t.List[QuadEdge],
     return result
 
 
-def set_criterion(target_edges: _t.Set[QuadEdge],
+def set_criterion(target_edges: OrderedEdges,
                   point_in_circle_locator: PointInCircleLocator) -> None:
     while True:
-        edges_to_swap = {
+        edges_to_swap = [
             edge
             for edge in target_edges
             if edge_should_be_swapped(edge, point_in_circle_locator)
-        }
+        ]
         if not edges_to_swap:
             break
         for edge in edges_to_swap:
             edge.swap()
-        target_edges.difference_update(edges_to_swap)
+        for edge in edges_to_swap:
+            del target_edges[edge]
+
+
+def to_packed_triangulation(sorted_points: _t.Sequence[Point],
+                            lengths: _t.Tuple[int, ...],
+                            context: Context) -> RawQuadEdges:
+    store = QuadEdgesStore(context)
+    result = merge_triangulations(triangulate_parts(
+            Triangulation, sorted_points, lengths, store.create_edge, context
+    ))
+    return pack_quad_edges(to_unique_edges(result), result.left_side,
+                           result.right_side,
+                           {point: index
+                            for index, point in enumerate(sorted_points)})
 
 
-def to_boundary_edges(triangulation: Triangulation) -> _t.Iterable[QuadEdge]:
+def to_boundary_edges(
+        triangulation: Triangulation
+) -> _t.Iterable[QuadEdgeLike]:
     return edges_with_opposites(to_unique_boundary_edges(triangulation))
 
 
-def to_edges(triangulation: Triangulation) -> _t.Iterable[QuadEdge]:
+def to_edges(triangulation: Triangulation) -> _t.Iterable[QuadEdgeLike]:
     return edges_with_opposites(to_unique_edges(triangulation))
 
 
 def to_left_candidate(
-        base_edge: QuadEdge, point_in_circle_locator: PointInCircleLocator
-) -> _t.Optional[QuadEdge]:
+        base_edge: QuadEdgeLike, point_in_circle_locator: PointInCircleLocator
+) -> _t.Optional[QuadEdgeLike]:
     result = base_edge.opposite.left_from_start
     if base_edge.orientation_of(result.end) is not Orientation.CLOCKWISE:
         return None
@@ -395,8 +605,8 @@ def to_left_candidate(
 
 
 def to_right_candidate(
-        base_edge: QuadEdge, point_in_circle_locator: PointInCircleLocator
-) -> _t.Optional[QuadEdge]:
+        base_edge: QuadEdgeLike, point_in_circle_locator: PointInCircleLocator
+) -> _t.Optional[QuadEdgeLike]:
     result = base_edge.right_from_start
     if (base_edge.orientation_of(result.end)
             is not Orientation.CLOCKWISE):
@@ -412,20 +622,78 @@ def to_right_candidate(
     return result
 
 
+def to_triangles_vertices(
+        triangulation: Triangulation
+) -> _t.Iterable[_t.Tuple[Point, Point, Point]]:
+    triangular_holes_vertices = triangulation._triangular_holes_vertices
+    for edge in to_edges(triangulation):
+        start, end = edge.start, edge.end
+        if not start < end:
+            continue
+        third = edge.left_from_start.end
+        # each triangle is yielded from the edge starting at its smallest
+        # vertex, so there is no need to keep visited triangles
+        if (start < third
+                and third == edge.opposite.right_from_start.end
+                and (edge.orientation_of(third)
+                     is Orientation.COUNTERCLOCKWISE)
+                and not (triangular_holes_vertices
+                         and (frozenset((start, end, third))
+                              in triangular_holes_vertices))):
+            yield start, end, third
+
+
+def triangulate_parts(cls: _t.Type[Triangulation],
+                      sorted_points: _t.Sequence[Point],
+                      lengths: _t.Tuple[int, ...],
+                      edge_factory: EdgeFactory,
+                      context: Context) -> _t.List[Triangulation]:
+    return [cls._initialize_triangulation(sorted_points[start:stop],
+                                          edge_factory, context)
+            for start, stop in pairwise(accumulate((0,) + lengths))]
+
+
+def triangulate_parts_in_parallel(
+        cls: _t.Type[Triangulation],
+        sorted_points: _t.Sequence[Point],
+        lengths: _t.Tuple[int, ...],
+        rounds_count: int,
+        workers: int,
+        store: _t.Optional[QuadEdgesStore],
+        context: Context
+) -> _t.List[Triangulation]:
+    group_size = 1 << rounds_count
+    offsets = list(accumulate((0,) + lengths))
+    groups_points, groups_lengths = [], []
+    for start in range(0, len(lengths), group_size):
+        stop = min(start + group_size, len(lengths))
+        groups_points.append(sorted_points[offsets[start]:offsets[stop]])
+        groups_lengths.append(lengths[start:stop])
+    with ProcessPoolExecutor(min(workers, len(groups_points))) as executor:
+        raws = list(executor.map(to_packed_triangulation, groups_points,
+                                 groups_lengths,
+                                 repeat(context, len(groups_points))))
+    return [cls(*unpack_quad_edges(raw, group_points, store, context),
+                context)
+            for raw, group_points in zip(raws, groups_points)]
+
+
 def to_unique_boundary_edges(
         triangulation: Triangulation
-) -> _t.Iterable[QuadEdge]:
+) -> _t.Iterable[QuadEdgeLike]:
     start = triangulation.left_side
     edge = start
     while True:
         yield edge
-        if edge.right_from_end is start:
+        if edge.right_from_end == start:
             break
         edge = edge.right_from_end
 
 
-def to_unique_edges(triangulation: Triangulation) -> _t.Iterable[QuadEdge]:
-    visited_edges: _t.Set[QuadEdge] = set()
+def to_unique_edges(
+        triangulation: Triangulation
+) -> _t.Iterable[QuadEdgeLike]:
+    visited_edges: _t.Set[QuadEdgeLike] = set()
     is_visited, visit_multiple = (visited_edges.__contains__,
                                   visited_edges.update)
     queue = [triangulation.left_side, triangulation.right_side]
@@ -439,13 +707,16 @@ def to_unique_edges(triangulation: Triangulation) -> _t.Iterable[QuadEdge]:
                       edge.right_from_start, edge.right_from_end))
 
 
-def to_unique_inner_edges(triangulation: Triangulation) -> _t.Set[QuadEdge]:
-    return (set(to_unique_edges(triangulation))
-            .difference(to_boundary_edges(triangulation)))
+def to_unique_inner_edges(triangulation: Triangulation) -> OrderedEdges:
+    boundary_edges = set(to_boundary_edges(triangulation))
+    return dict.fromkeys(edge
+                         for edge in to_unique_edges(triangulation)
+                         if edge not in boundary_edges)
 
 
 BaseCase = _t.Callable[
-    [_t.Type[Triangulation], _t.Sequence[Point], Context], Triangulation
+    [_t.Type[Triangulation], _t.Sequence[Point], EdgeFactory, Context],
+    Triangulation
 ]
 base_cases: _t.Dict[int, BaseCase] = {}
 register_base_case = partial(partial, base_cases.setdefault)
@@ -454,21 +725,20 @@ register_base_case = partial(partial, base_cases.setdefault)
 @register_base_case(2)
 def triangulate_two_points(cls: _t.Type[Triangulation],
                            sorted_points: _t.Sequence[Point],
+                           edge_factory: EdgeFactory,
                            context: Context) -> Triangulation:
-    first_edge = QuadEdge.from_endpoints(*sorted_points,
-                                         context=context)
+    first_edge = edge_factory(*sorted_points)
     return cls(first_edge, first_edge.opposite, context)
 
 
 @register_base_case(3)
 def triangulate_three_points(cls: _t.Type[Triangulation],
                              sorted_points: _t.Sequence[Point],
+                             edge_factory: EdgeFactory,
                              context: Context) -> Triangulation:
     left_point, mid_point, right_point = sorted_points
-    first_edge, second_edge = (QuadEdge.from_endpoints(left_point, mid_point,
-                                                       context=context),
-                               QuadEdge.from_endpoints(mid_point, right_point,
-                                                       context=context))
+    first_edge, second_edge = (edge_factory(left_point, mid_point),
+                               edge_factory(mid_point, right_point))
     first_edge.opposite.splice(second_edge)
     orientation = first_edge.orientation_of(right_point)
     if orientation is Orientation.COUNTERCLOCKWISE:
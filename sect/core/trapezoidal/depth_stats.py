@@ -0,0 +1,14 @@
+from typing import NamedTuple
+
+
+class DepthStats(NamedTuple):
+    """
+    Represents summary of depths of decomposition graph's leaves,
+    where depth of a leaf is the length of the longest path
+    from the root to it.
+    """
+    height: int
+    leaves_count: int
+    mean_leaf_depth: float
+    min_leaf_depth: int
+    nodes_count: int
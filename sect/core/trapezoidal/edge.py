@@ -9,30 +9,39 @@ from reprit.base import generate_repr
 
 
 class Edge:
+    """
+    Represents edge of decomposed geometry
+    with lexicographically ordered endpoints.
+    """
+
     @classmethod
     def from_endpoints(cls,
                        left: Point,
                        right: Point,
                        interior_to_left: bool,
-                       context: Context) -> Edge:
+                       context: Context,
+                       owner: int = 0) -> Edge:
         """Constructs edge given its endpoints."""
-        return cls(left, right, interior_to_left, context)
+        return cls(left, right, interior_to_left, context, owner)
 
     def orientation_of(self, point: Point) -> Orientation:
         """Returns orientation of the point relative to the edge."""
         return self.context.angle_orientation(self.left, self.right, point)
 
-    __slots__ = 'context', 'interior_to_left', 'left', 'right'
+    __slots__ = ('context', 'interior_to_left', 'left', 'owner', 'removed',
+                 'right')
 
     def __init__(self,
                  left: Point,
                  right: Point,
                  interior_to_left: bool,
-                 context: Context) -> None:
+                 context: Context,
+                 owner: int = 0) -> None:
         assert left < right, 'Incorrect endpoints order'
-        self.context, self.interior_to_left, self.left, self.right = (
-            context, interior_to_left, left, right
-        )
+        (self.context, self.interior_to_left, self.left, self.owner,
+         self.right) = context, interior_to_left, left, owner, right
+        # removed edges keep splitting trapezoids until the graph is rebuilt
+        self.removed = False
 
     def __lt__(self, other: Edge) -> Any:
         """Checks if the edge is lower than the other."""
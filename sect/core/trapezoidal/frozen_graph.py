@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+from array import array
+from typing import (Dict,
+                    List,
+                    Sequence)
+
+from ground.base import (Context,
+                         Location,
+                         Orientation)
+from ground.hints import Point
+from reprit.base import generate_repr
+
+from .edge import Edge
+from .leaf import Leaf
+from .node import Node
+from .utils import to_nodes
+from .x_node import XNode
+from .y_node import (ORIENTATION_ERROR_BOUND,
+                     YNode)
+
+LEAF_KIND, X_NODE_KIND, Y_NODE_KIND = range(3)
+
+
+class FrozenGraph:
+    """
+    Represents trapezoidal decomposition graph
+    compiled into flat arrays for read-only point location.
+
+    Node with index ``0`` is the root,
+    ``kinds`` hold kinds of nodes,
+    ``firsts`` & ``seconds`` hold indices of left/below and right/above
+    children of x-nodes/y-nodes respectively,
+    ``payloads`` hold indices of points in ``points`` for x-nodes,
+    indices of edges in ``endpoints`` for y-nodes
+    and component flags for leaves,
+    ``endpoints`` hold indices of edges' endpoints in ``points``
+    with left endpoint of the edge with index ``index``
+    being at ``2 * index`` and right one being at ``2 * index + 1``,
+    ``removals`` hold flags of x-nodes & y-nodes
+    with removed points & edges respectively,
+    which send points they pass through to the right/above child.
+    """
+
+    @classmethod
+    def from_root(cls, root: Node, height: int) -> FrozenGraph:
+        """
+        Compiles decomposition graph given its root node and height.
+
+        Time complexity:
+            ``O(nodes_count)``
+        Memory complexity:
+            ``O(nodes_count)``
+
+        where ``nodes_count`` is the number of distinct nodes
+        reachable from the root.
+        """
+        nodes = to_nodes(root)
+        nodes_indices = {id(node): index for index, node in enumerate(nodes)}
+        points: List[Point] = []
+        points_indices: Dict[Point, int] = {}
+        edges_indices: Dict[int, int] = {}
+        endpoints, removals = array('l'), array('B', bytes(len(nodes)))
+
+        def to_point_index(point: Point) -> int:
+            try:
+                return points_indices[point]
+            except KeyError:
+                result = points_indices[point] = len(points)
+                points.append(point)
+                return result
+
+        def to_edge_index(edge: Edge) -> int:
+            try:
+                return edges_indices[id(edge)]
+            except KeyError:
+                result = edges_indices[id(edge)] = len(endpoints) // 2
+                endpoints.extend((to_point_index(edge.left),
+                                  to_point_index(edge.right)))
+                return result
+
+        nodes_count = len(nodes)
+        kinds = array('B', bytes(nodes_count))
+        firsts, seconds, payloads = (array('l', [0]) * nodes_count,
+                                     array('l', [0]) * nodes_count,
+                                     array('l', [0]) * nodes_count)
+        context = None
+        for index, node in enumerate(nodes):
+            if isinstance(node, XNode):
+                kinds[index] = X_NODE_KIND
+                firsts[index] = nodes_indices[id(node.left)]
+                seconds[index] = nodes_indices[id(node.right)]
+                payloads[index] = to_point_index(node.point)
+                removals[index] = node.removed
+            elif isinstance(node, YNode):
+                kinds[index] = Y_NODE_KIND
+                firsts[index] = nodes_indices[id(node.below)]
+                seconds[index] = nodes_indices[id(node.above)]
+                payloads[index] = to_edge_index(node.edge)
+                removals[index] = node.edge.removed
+                context = node.edge.context
+            else:
+                assert isinstance(node, Leaf)
+                trapezoid = node.trapezoid
+                payloads[index] = trapezoid.component
+                if context is None:
+                    context = trapezoid.below.context
+        assert context is not None
+        return cls(kinds, firsts, seconds, payloads, points, endpoints,
+                   removals, height, context)
+
+    def locate(self, point: Point) -> Location:
+        """
+        Finds location of point relative to decomposed geometry.
+
+        Time complexity:
+            ``O(self.height)``
+        Memory complexity:
+            ``O(1)``
+        """
+        (kinds, firsts, seconds, payloads, points, endpoints, removals,
+         orienteer) = (self.kinds, self.firsts, self.seconds, self.payloads,
+                       self.points, self.endpoints, self.removals,
+                       self.context.angle_orientation)
+        index = 0
+        while True:
+            kind = kinds[index]
+            if kind == X_NODE_KIND:
+                node_point = points[payloads[index]]
+                if point < node_point:
+                    index = firsts[index]
+                elif node_point < point or removals[index]:
+                    index = seconds[index]
+                else:
+                    return Location.BOUNDARY
+            elif kind == Y_NODE_KIND:
+                edge_index = 2 * payloads[index]
+                point_orientation = orienteer(points[endpoints[edge_index]],
+                                              points[endpoints[edge_index
+                                                               + 1]],
+                                              point)
+                if point_orientation is Orientation.CLOCKWISE:
+                    index = firsts[index]
+                elif (point_orientation is Orientation.COUNTERCLOCKWISE
+                      or removals[index]):
+                    index = seconds[index]
+                else:
+                    return Location.BOUNDARY
+            else:
+                return (Location.INTERIOR
+                        if payloads[index]
+                        else Location.EXTERIOR)
+
+    def locate_array(self,
+                     xs: Sequence[float],
+                     ys: Sequence[float]) -> List[Location]:
+        """
+        Finds locations of points with given floating point coordinates
+        relative to decomposed geometry.
+
+        Orientation tests are evaluated in floating point arithmetic
+        with static error bound filter,
+        falling back to the context's predicate
+        for near-degenerate cases and for edges
+        with endpoints not representable by floats,
+        so results are the same as for ``FrozenGraph.locate``
+        without constructing points.
+
+        Time complexity:
+            ``O(len(xs) * self.height + points_count)``
+        Memory complexity:
+            ``O(len(xs) + points_count)``
+
+        where ``points_count = len(self.points)``.
+
+        :param xs: abscissas of points.
+        :param ys: ordinates of points.
+        :returns: locations of points.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+        ...                            context.polygon_cls)
+        >>> from sect.decomposition import Graph
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]),
+        ...             [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                       Point(4, 2)])]),
+        ...     context=context
+        ... )
+        >>> frozen_graph = graph.freeze()
+        >>> (frozen_graph.locate_array([1., 2., 3.], [1., 2.5, 3.])
+        ...  == [Location.INTERIOR, Location.BOUNDARY, Location.EXTERIOR])
+        True
+        """
+        assert len(xs) == len(ys), 'Coordinates should have the same length.'
+        (kinds, firsts, seconds, payloads, points, endpoints, removals,
+         orienteer, point_cls) = (self.kinds, self.firsts, self.seconds,
+                                  self.payloads, self.points, self.endpoints,
+                                  self.removals,
+                                  self.context.angle_orientation,
+                                  self.context.point_cls)
+        points_xs = [float(point.x) for point in points]
+        points_ys = [float(point.y) for point in points]
+        points_are_floats = [
+            point_x == point.x and point_y == point.y
+            for point, point_x, point_y in zip(points, points_xs, points_ys)
+        ]
+        boundary, exterior, interior = (Location.BOUNDARY, Location.EXTERIOR,
+                                        Location.INTERIOR)
+        clockwise, counterclockwise = (Orientation.CLOCKWISE,
+                                       Orientation.COUNTERCLOCKWISE)
+        result: List[Location] = []
+        push = result.append
+        for x, y in zip(xs, ys):
+            index = 0
+            while True:
+                kind = kinds[index]
+                if kind == X_NODE_KIND:
+                    node_point = points[payloads[index]]
+                    node_x = node_point.x
+                    if x < node_x or x == node_x and y < node_point.y:
+                        index = firsts[index]
+                    elif (x != node_x or y != node_point.y
+                          or removals[index]):
+                        index = seconds[index]
+                    else:
+                        push(boundary)
+                        break
+                elif kind == Y_NODE_KIND:
+                    edge_index = 2 * payloads[index]
+                    start_index, end_index = (endpoints[edge_index],
+                                              endpoints[edge_index + 1])
+                    if (points_are_floats[start_index]
+                            and points_are_floats[end_index]):
+                        start_x, start_y = (points_xs[start_index],
+                                            points_ys[start_index])
+                        minuend = ((start_x - x)
+                                   * (points_ys[end_index] - y))
+                        subtrahend = ((start_y - y)
+                                      * (points_xs[end_index] - x))
+                        determinant = minuend - subtrahend
+                        if (abs(determinant)
+                                > ORIENTATION_ERROR_BOUND
+                                * (abs(minuend) + abs(subtrahend))):
+                            index = (seconds[index]
+                                     if determinant > 0
+                                     else firsts[index])
+                            continue
+                    point_orientation = orienteer(points[start_index],
+                                                  points[end_index],
+                                                  point_cls(x, y))
+                    if point_orientation is clockwise:
+                        index = firsts[index]
+                    elif (point_orientation is counterclockwise
+                          or removals[index]):
+                        index = seconds[index]
+                    else:
+                        push(boundary)
+                        break
+                else:
+                    push(interior if payloads[index] else exterior)
+                    break
+        return result
+
+    def locate_many(self, points: Sequence[Point]) -> List[Location]:
+        """
+        Finds locations of points relative to decomposed geometry.
+
+        Time complexity:
+            ``O(len(points) * self.height)``
+        Memory complexity:
+            ``O(len(points))``
+        """
+        locate = self.locate
+        return [locate(point) for point in points]
+
+    __slots__ = ('context', 'endpoints', 'firsts', 'height', 'kinds',
+                 'payloads', 'points', 'removals', 'seconds')
+
+    def __init__(self,
+                 kinds: array[int],
+                 firsts: array[int],
+                 seconds: array[int],
+                 payloads: array[int],
+                 points: Sequence[Point],
+                 endpoints: array[int],
+                 removals: array[int],
+                 height: int,
+                 context: Context) -> None:
+        """
+        Initializes graph.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+        """
+        (self.context, self.endpoints, self.firsts, self.height, self.kinds,
+         self.payloads, self.points, self.removals, self.seconds) = (
+            context, endpoints, firsts, height, kinds, payloads, points,
+            removals, seconds
+        )
+
+    __repr__ = generate_repr(__init__)
+
+    def __contains__(self, point: Point) -> bool:
+        """
+        Checks if point is contained in decomposed geometry.
+
+        Time complexity:
+            ``O(self.height)``
+        Memory complexity:
+            ``O(1)``
+        """
+        return bool(self.locate(point))
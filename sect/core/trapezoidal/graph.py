@@ -1,37 +1,168 @@
 from __future__ import annotations
 
 import random
-from typing import (List,
+from collections import Counter
+from fractions import Fraction
+from itertools import islice
+from math import log2
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Iterable,
+                    Iterator,
+                    List,
+                    Optional,
+                    Sequence,
                     Tuple)
 
 from ground.base import (Context,
                          Location,
-                         Orientation)
+                         Mode,
+                         Orientation,
+                         Relation)
 from ground.hints import (Box,
+                          Multipolygon,
                           Multisegment,
                           Point,
-                          Polygon)
+                          Polygon,
+                          Scalar,
+                          Segment)
 from reprit.base import generate_repr
 
 from sect.core.utils import (contour_to_edges_endpoints,
+                             flatten,
                              to_contour_orientation)
+from .depth_stats import DepthStats
 from .edge import Edge
+from .frozen_graph import FrozenGraph
 from .hints import Shuffler
 from .leaf import Leaf
 from .node import Node
+from .packing import (RawGraph,
+                      pack_root,
+                      unpack_root)
 from .trapezoid import Trapezoid
+from .utils import (release_parents,
+                    restore_parents,
+                    to_children,
+                    to_nodes)
 from .x_node import XNode
-from .y_node import YNode
+from .y_node import (YNode,
+                     to_filtered_coordinate)
 
 
 class Graph:
     """Represents trapezoidal decomposition graph."""
 
+    @classmethod
+    def from_multipolygon(cls,
+                          multipolygon: Multipolygon,
+                          *,
+                          shuffler: Shuffler = random.shuffle,
+                          seed: Optional[int] = None,
+                          max_height_factor: Optional[float] = None,
+                          max_rebuilds_count: int = 16,
+                          context: Context) -> Graph:
+        """
+        Constructs trapezoidal decomposition graph of given multipolygon.
+
+        Edges of each polygon are labeled with its index,
+        so single search finds the polygon containing a point
+        (see :meth:`find_polygon_index`).
+
+        Based on incremental randomized algorithm by R. Seidel.
+
+        Time complexity:
+            ``O(vertices_count * log vertices_count)`` expected,
+            ``O(vertices_count ** 2)`` worst
+        Memory complexity:
+            ``O(vertices_count)``
+
+        where
+
+            .. code-block:: python
+
+                vertices_count = sum(len(polygon.border.vertices)
+                                     + sum(len(hole.vertices)
+                                           for hole in polygon.holes)
+                                     for polygon in multipolygon.polygons)
+
+        Reference:
+            https://doi.org/10.1016%2F0925-7721%2891%2990012-4
+            https://www.cs.princeton.edu/courses/archive/fall05/cos528/handouts/A%20Simple%20and%20fast.pdf
+
+        :param multipolygon: target multipolygon.
+        :param shuffler:
+            function which mutates sequence by shuffling its elements,
+            required for randomization,
+            permutation of edges used for the result is stored
+            in ``permutation`` attribute of the result
+            and can be reused with ``PermutationShuffler``.
+        :param seed:
+            if specified, edges get shuffled
+            by random numbers generator with given seed
+            instead of ``shuffler``, which makes construction reproducible.
+        :param max_height_factor:
+            if specified, the graph gets rebuilt with reshuffled edges
+            while its height exceeds
+            ``max_height_factor * log2(edges_count + 1)``,
+            where ``edges_count`` is the number of decomposed edges.
+        :param max_rebuilds_count:
+            maximum number of rebuilds,
+            after which the lowest of built graphs is returned,
+            number of performed rebuilds is stored
+            in ``rebuilds_count`` attribute of the result.
+        :param context: geometric context.
+        :returns: trapezoidal decomposition graph of the polygons.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Multipolygon, Point, Polygon = (
+        ...     context.contour_cls, context.multipolygon_cls,
+        ...     context.point_cls, context.polygon_cls
+        ... )
+        >>> graph = Graph.from_multipolygon(
+        ...     Multipolygon([Polygon(Contour([Point(0, 0), Point(2, 0),
+        ...                                    Point(2, 2), Point(0, 2)]),
+        ...                           []),
+        ...                   Polygon(Contour([Point(3, 0), Point(5, 0),
+        ...                                    Point(5, 2), Point(3, 2)]),
+        ...                           [])]),
+        ...     context=context
+        ... )
+        >>> Point(1, 1) in graph
+        True
+        >>> Point(4, 1) in graph
+        True
+        >>> graph.locate(Point(2, 1)) is Location.BOUNDARY
+        True
+        >>> graph.locate(Point(2.5, 1)) is Location.EXTERIOR
+        True
+        >>> graph.find_polygon_index(Point(1, 1))
+        0
+        >>> graph.find_polygon_index(Point(4, 1))
+        1
+        >>> graph.find_polygon_index(Point(2.5, 1)) is None
+        True
+        """
+        polygons = multipolygon.polygons
+        edges = list(flatten(polygon_to_edges(polygon, index, context)
+                             for index, polygon in enumerate(polygons)))
+        return cls._from_box_with_edges(
+                context.contours_box([polygon.border
+                                      for polygon in polygons]),
+                edges, shuffler, seed, max_height_factor, max_rebuilds_count,
+                context
+        )
+
     @classmethod
     def from_multisegment(cls,
                           multisegment: Multisegment,
                           *,
                           shuffler: Shuffler = random.shuffle,
+                          seed: Optional[int] = None,
+                          max_height_factor: Optional[float] = None,
+                          max_rebuilds_count: int = 16,
                           context: Context) -> Graph:
         """
         Constructs trapezoidal decomposition graph of given multisegment.
@@ -53,7 +184,24 @@ class Graph:
         :param multisegment: target multisegment.
         :param shuffler:
             function which mutates sequence by shuffling its elements,
-            required for randomization.
+            required for randomization,
+            permutation of edges used for the result is stored
+            in ``permutation`` attribute of the result
+            and can be reused with ``PermutationShuffler``.
+        :param seed:
+            if specified, edges get shuffled
+            by random numbers generator with given seed
+            instead of ``shuffler``, which makes construction reproducible.
+        :param max_height_factor:
+            if specified, the graph gets rebuilt with reshuffled edges
+            while its height exceeds
+            ``max_height_factor * log2(edges_count + 1)``,
+            where ``edges_count`` is the number of decomposed edges.
+        :param max_rebuilds_count:
+            maximum number of rebuilds,
+            after which the lowest of built graphs is returned,
+            number of performed rebuilds is stored
+            in ``rebuilds_count`` attribute of the result.
         :param context: geometric context.
         :returns: trapezoidal decomposition graph of the multisegment.
 
@@ -89,7 +237,7 @@ class Graph:
         ]
         return cls._from_box_with_edges(
                 context.segments_box(multisegment.segments), edges, shuffler,
-                context
+                seed, max_height_factor, max_rebuilds_count, context
         )
 
     @classmethod
@@ -97,6 +245,9 @@ class Graph:
                      polygon: Polygon,
                      *,
                      shuffler: Shuffler = random.shuffle,
+                     seed: Optional[int] = None,
+                     max_height_factor: Optional[float] = None,
+                     max_rebuilds_count: int = 16,
                      context: Context) -> Graph:
         """
         Constructs trapezoidal decomposition graph of given polygon.
@@ -125,7 +276,24 @@ class Graph:
         :param polygon: target polygon.
         :param shuffler:
             function which mutates sequence by shuffling its elements,
-            required for randomization.
+            required for randomization,
+            permutation of edges used for the result is stored
+            in ``permutation`` attribute of the result
+            and can be reused with ``PermutationShuffler``.
+        :param seed:
+            if specified, edges get shuffled
+            by random numbers generator with given seed
+            instead of ``shuffler``, which makes construction reproducible.
+        :param max_height_factor:
+            if specified, the graph gets rebuilt with reshuffled edges
+            while its height exceeds
+            ``max_height_factor * log2(edges_count + 1)``,
+            where ``edges_count`` is the number of decomposed edges.
+        :param max_rebuilds_count:
+            maximum number of rebuilds,
+            after which the lowest of built graphs is returned,
+            number of performed rebuilds is stored
+            in ``rebuilds_count`` attribute of the result.
         :param context: geometric context.
         :returns: trapezoidal decomposition graph of the border and holes.
 
@@ -154,44 +322,447 @@ class Graph:
         True
         """
         border = polygon.border
-        orienteer = context.angle_orientation
-        is_border_positively_oriented = (to_contour_orientation(border,
-                                                                orienteer)
-                                         is Orientation.COUNTERCLOCKWISE)
-        edges = [
-            Edge.from_endpoints(start, end, is_border_positively_oriented,
-                                context)
-            if start < end
-            else Edge.from_endpoints(end, start,
-                                     not is_border_positively_oriented,
-                                     context)
-            for start, end in contour_to_edges_endpoints(border)
-        ]
-        for hole in polygon.holes:
-            is_hole_negatively_oriented = (
-                    to_contour_orientation(hole, orienteer)
-                    is Orientation.CLOCKWISE
-            )
-            edges.extend(
-                    Edge.from_endpoints(start, end,
-                                        is_hole_negatively_oriented, context)
-                    if start < end
-                    else
-                    Edge.from_endpoints(end, start,
-                                        not is_hole_negatively_oriented,
-                                        context)
-                    for start, end in contour_to_edges_endpoints(hole)
-            )
+        edges = polygon_to_edges(polygon, 0, context)
         return cls._from_box_with_edges(context.contour_box(border), edges,
-                                        shuffler, context)
+                                        shuffler, seed, max_height_factor,
+                                        max_rebuilds_count, context)
 
     @property
     def height(self) -> int:
         """
         Returns height of the root node.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
         """
         return self.root.height
 
+    def area(self) -> Scalar:
+        """
+        Returns area of decomposed geometry.
+
+        Integrals are summed over edges bounding component trapezoids
+        from below & above, which is exact for exact contexts.
+
+        Time complexity:
+            ``O(nodes_count)``
+        Memory complexity:
+            ``O(nodes_count)``
+
+        where ``nodes_count`` is the number of distinct nodes of the graph.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+        ...                            context.polygon_cls)
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]),
+        ...             [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                       Point(4, 2)])]),
+        ...     context=context
+        ... )
+        >>> graph.area() == 32
+        True
+        """
+        double_area, _, _ = to_components_moments(self)
+        return double_area / 2
+
+    def centroid(self) -> Point:
+        """
+        Returns centroid of decomposed geometry.
+
+        Time complexity:
+            ``O(nodes_count)``
+        Memory complexity:
+            ``O(nodes_count)``
+
+        where ``nodes_count`` is the number of distinct nodes of the graph.
+
+        :raises ValueError: if decomposed geometry has zero area.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+        ...                            context.polygon_cls)
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]),
+        ...             [Contour([Point(3, 2), Point(3, 4), Point(5, 4),
+        ...                       Point(5, 2)])]),
+        ...     context=context
+        ... )
+        >>> graph.centroid() == Point(2.875, 3)
+        True
+        """
+        double_area, x_numerator, y_numerator = to_components_moments(self)
+        if not double_area:
+            raise ValueError('Decomposed geometry should have non-zero area.')
+        inverted_divisor = 1 / (3 * double_area)
+        return to_bounding_edges(self.root)[0].context.point_cls(
+                x_numerator * inverted_divisor, y_numerator * inverted_divisor
+        )
+
+    def compact(self) -> None:
+        """
+        Releases links from nodes to their parents
+        which are used only for modification of the search structure,
+        reducing memory footprint of read-only graphs.
+
+        Links are restored on the next insertion,
+        graph state is stored in ``compacted`` attribute.
+
+        Time complexity:
+            ``O(nodes_count)``
+        Memory complexity:
+            ``O(nodes_count)``
+
+        where ``nodes_count`` is the number of distinct nodes of the graph.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Multisegment, Point, Segment = (context.multisegment_cls,
+        ...                                 context.point_cls,
+        ...                                 context.segment_cls)
+        >>> graph = Graph.from_multisegment(
+        ...     Multisegment([Segment(Point(0, 0), Point(4, 0)),
+        ...                   Segment(Point(0, 4), Point(4, 4))]),
+        ...     context=context
+        ... )
+        >>> graph.compact()
+        >>> graph.compacted
+        True
+        >>> graph.locate(Point(2, 0)) is Location.BOUNDARY
+        True
+        >>> graph.insert(Segment(Point(0, 2), Point(4, 2)))
+        >>> graph.compacted
+        False
+        >>> graph.locate(Point(2, 2)) is Location.BOUNDARY
+        True
+        """
+        if not self.compacted:
+            release_parents(self.root)
+            self.compacted = True
+
+    def contains_many(self, points: Sequence[Point]) -> List[bool]:
+        """
+        Checks if points are contained in decomposed geometry.
+
+        Time complexity:
+            ``O(len(points) * self.height)``
+        Memory complexity:
+            ``O(len(points))``
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+        ...                            context.polygon_cls)
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]),
+        ...             [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                       Point(4, 2)])]),
+        ...     context=context
+        ... )
+        >>> graph.contains_many([Point(1, 1), Point(2, 2), Point(3, 3)])
+        [True, True, False]
+        """
+        return [bool(location) for location in self.locate_many(points)]
+
+    def depth_stats(self) -> DepthStats:
+        """
+        Returns summary of depths of the graph's leaves.
+
+        Time complexity:
+            ``O(nodes_count)``
+        Memory complexity:
+            ``O(nodes_count)``
+
+        where ``nodes_count`` is the number of distinct nodes of the graph.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+        ...                            context.polygon_cls)
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]), []),
+        ...     context=context
+        ... )
+        >>> stats = graph.depth_stats()
+        >>> stats.height == graph.height
+        True
+        >>> 0 < stats.min_leaf_depth <= stats.mean_leaf_depth <= stats.height
+        True
+        """
+        nodes = to_nodes(self.root)
+        parents_counts = Counter(id(child)
+                                 for node in nodes
+                                 for child in to_children(node))
+        depths = {id(self.root): 0}
+        leaves_depths = []
+        queue = [self.root]
+        while queue:
+            node = queue.pop()
+            children = to_children(node)
+            if not children:
+                leaves_depths.append(depths[id(node)])
+                continue
+            child_depth = depths[id(node)] + 1
+            for child in children:
+                child_id = id(child)
+                depths[child_id] = max(depths.get(child_id, 0), child_depth)
+                parents_counts[child_id] -= 1
+                if not parents_counts[child_id]:
+                    queue.append(child)
+        return DepthStats(height=self.height,
+                          leaves_count=len(leaves_depths),
+                          mean_leaf_depth=(sum(leaves_depths)
+                                           / len(leaves_depths)),
+                          min_leaf_depth=min(leaves_depths),
+                          nodes_count=len(nodes))
+
+    def find_polygon_index(self, point: Point) -> Optional[int]:
+        """
+        Finds index of the decomposed polygon
+        which interior contains given point
+        (``0`` for graphs constructed from a single polygon),
+        returns ``None`` for points on the boundary or in the exterior.
+
+        Time complexity:
+            ``O(self.height)``
+        Memory complexity:
+            ``O(1)``
+        """
+        trapezoid = self.find_trapezoid(point)
+        return (trapezoid.below.owner
+                if trapezoid is not None and trapezoid.component
+                else None)
+
+    def find_trapezoid(self, point: Point) -> Optional[Trapezoid]:
+        """
+        Finds trapezoid of the decomposition which contains given point,
+        returns ``None`` for points on edges of decomposed geometry.
+
+        Trapezoid is bounded by ``below`` & ``above`` edges
+        and vertical lines through ``left`` & ``right`` points,
+        points on these lines are attributed to trapezoids
+        according to lexicographical order of points.
+        Trapezoids are preserved until the graph is modified,
+        so they can be used as keys for attaching payloads to regions.
+
+        Time complexity:
+            ``O(self.height)``
+        Memory complexity:
+            ``O(1)``
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+        ...                            context.polygon_cls)
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]), []),
+        ...     context=context
+        ... )
+        >>> trapezoid = graph.find_trapezoid(Point(1, 1))
+        >>> trapezoid.component
+        True
+        >>> trapezoid.left == Point(0, 6) and trapezoid.right == Point(6, 0)
+        True
+        >>> (trapezoid.below.left == Point(0, 0)
+        ...  and trapezoid.below.right == Point(6, 0))
+        True
+        >>> trapezoid is graph.find_trapezoid(Point(2, 3))
+        True
+        >>> graph.find_trapezoid(Point(3, 0)) is None
+        True
+        """
+        return self.root.search_point(point)
+
+    def freeze(self) -> FrozenGraph:
+        """
+        Compiles the graph into flat arrays for read-only point location.
+
+        Removed edges & their endpoints are compiled along with the others
+        and are skipped by point location in the same way.
+
+        Time complexity:
+            ``O(nodes_count)``
+        Memory complexity:
+            ``O(nodes_count)``
+
+        where ``nodes_count`` is the number of distinct nodes of the graph.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+        ...                            context.polygon_cls)
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]),
+        ...             [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                       Point(4, 2)])]),
+        ...     context=context
+        ... )
+        >>> frozen_graph = graph.freeze()
+        >>> Point(1, 1) in frozen_graph
+        True
+        >>> Point(3, 3) in frozen_graph
+        False
+        >>> frozen_graph.locate(Point(2, 2)) is Location.BOUNDARY
+        True
+        """
+        return FrozenGraph.from_root(self.root, self.height)
+
+    def insert(self, segment: Segment) -> None:
+        """
+        Inserts given segment into the decomposition in place.
+
+        Segment is inserted as an edge without interior
+        (like segments of decomposed multisegments),
+        so it should not cross interior of decomposed polygons,
+        it should lie strictly inside of the graph's bounding box
+        and should intersect already decomposed edges
+        only at common endpoints.
+
+        Time complexity:
+            ``O(self.height + crossed_trapezoids_count)``,
+            which is ``O(log edges_count)`` expected
+            for segments coming in random order
+        Memory complexity:
+            ``O(crossed_trapezoids_count)``
+
+        where ``crossed_trapezoids_count`` is the number of trapezoids
+        crossed by the segment,
+        ``edges_count`` is the number of decomposed edges.
+
+        :param segment: segment to insert.
+        :raises ValueError:
+            if the segment is degenerate, does not lie strictly inside
+            of the graph's bounding box,
+            crosses interior of decomposed polygons
+            or intersects some of decomposed edges
+            not at common endpoints.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Multisegment, Point, Segment = (context.multisegment_cls,
+        ...                                 context.point_cls,
+        ...                                 context.segment_cls)
+        >>> graph = Graph.from_multisegment(
+        ...     Multisegment([Segment(Point(0, 0), Point(4, 0)),
+        ...                   Segment(Point(0, 4), Point(4, 4))]),
+        ...     context=context
+        ... )
+        >>> graph.locate(Point(2, 2)) is Location.EXTERIOR
+        True
+        >>> graph.insert(Segment(Point(0, 2), Point(4, 2)))
+        >>> graph.locate(Point(2, 2)) is Location.BOUNDARY
+        True
+        >>> graph.insert(Segment(Point(2, 0), Point(2, 4)))
+        Traceback (most recent call last):
+            ...
+        ValueError: Segment should meet decomposed edges only at endpoints.
+        >>> Contour, Polygon = context.contour_cls, context.polygon_cls
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]), []),
+        ...     context=context
+        ... )
+        >>> graph.insert(Segment(Point(1, 3), Point(5, 3)))
+        Traceback (most recent call last):
+            ...
+        ValueError: Segment should not cross interior of decomposed polygons.
+        >>> graph.locate(Point(3, 4)) is Location.INTERIOR
+        True
+        """
+        start, end = segment.start, segment.end
+        if start == end:
+            raise ValueError('Segment should not be degenerate.')
+        bottom, top = to_bounding_edges(self.root)
+        min_x, min_y, max_x, max_y = (bottom.left.x, bottom.left.y,
+                                      top.right.x, top.right.y)
+        if not (min_x < start.x < max_x and min_x < end.x < max_x
+                and min_y < start.y < max_y and min_y < end.y < max_y):
+            raise ValueError('Segment should lie strictly inside '
+                             'of the graph\'s bounding box.')
+        context = bottom.context
+        edge = (Edge.from_endpoints(start, end, False, context)
+                if start < end
+                else Edge.from_endpoints(end, start, False, context))
+        try:
+            add_checked_edge(self, edge)
+        except ValueError:
+            if not self._removed_edges_count:
+                raise
+            # removed edges still split trapezoids and can be in the way
+            self._rebuild(random.shuffle)
+            add_checked_edge(self, edge)
+        endpoints_degrees = self._endpoints_degrees
+        if endpoints_degrees is not None:
+            self._edges_count += 1
+            for endpoint in (edge.left, edge.right):
+                degree = endpoints_degrees.get(endpoint, 0)
+                if endpoint in endpoints_degrees and not degree:
+                    x_node = search_point_x_node(self.root, endpoint)
+                    assert x_node is not None, 'Endpoint is not found.'
+                    x_node.removed = False
+                endpoints_degrees[endpoint] = degree + 1
+        self.modifications_count += 1
+
+    def insert_many(self,
+                    segments: Iterable[Segment],
+                    *,
+                    shuffler: Shuffler = random.shuffle) -> None:
+        """
+        Inserts given segments into the decomposition in place.
+
+        Segments are shuffled before insertion
+        to keep expected height of the graph logarithmic,
+        each of them should satisfy requirements of ``Graph.insert``,
+        segments preceding the first invalid one remain inserted.
+
+        Time complexity:
+            ``O(segments_count * log edges_count)`` expected,
+            ``O(segments_count * edges_count)`` worst
+        Memory complexity:
+            ``O(segments_count)``
+
+        where ``segments_count`` is the number of inserted segments,
+        ``edges_count`` is the number of decomposed edges.
+
+        :param segments: segments to insert.
+        :param shuffler:
+            function which mutates sequence by shuffling its elements,
+            required for randomization.
+        :raises ValueError:
+            if some of the segments cannot be inserted.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Multisegment, Point, Segment = (context.multisegment_cls,
+        ...                                 context.point_cls,
+        ...                                 context.segment_cls)
+        >>> graph = Graph.from_multisegment(
+        ...     Multisegment([Segment(Point(0, 0), Point(4, 0)),
+        ...                   Segment(Point(0, 4), Point(4, 4))]),
+        ...     context=context
+        ... )
+        >>> graph.insert_many([Segment(Point(0, 0), Point(0, 4)),
+        ...                    Segment(Point(4, 0), Point(4, 4))])
+        >>> graph.locate(Point(0, 2)) is Location.BOUNDARY
+        True
+        >>> graph.locate(Point(4, 2)) is Location.BOUNDARY
+        True
+        """
+        segments = list(segments)
+        shuffler(segments)
+        for segment in segments:
+            self.insert(segment)
+
     def locate(self, point: Point) -> Location:
         """
         Finds location of point relative to decomposed geometry.
@@ -203,9 +774,514 @@ class Graph:
         """
         return self.root.locate(point)
 
-    __slots__ = 'root',
+    def locate_many(self, points: Sequence[Point]) -> List[Location]:
+        """
+        Finds locations of points relative to decomposed geometry.
+
+        Points are passed through the search structure together,
+        so each node is visited at most once per group of points reaching it
+        and its edge's coordinates are prepared once per such group
+        for floating point orientation tests with static error bound filter,
+        falling back to the context's predicate for near-degenerate cases.
+
+        Time complexity:
+            ``O(len(points) * self.height)``
+        Memory complexity:
+            ``O(len(points))``
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+        ...                            context.polygon_cls)
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]),
+        ...             [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                       Point(4, 2)])]),
+        ...     context=context
+        ... )
+        >>> (graph.locate_many([Point(1, 1), Point(2, 2), Point(3, 3)])
+        ...  == [Location.INTERIOR, Location.BOUNDARY, Location.EXTERIOR])
+        True
+        """
+        result = [Location.EXTERIOR] * len(points)
+        if not points:
+            return result
+        xs = [to_filtered_coordinate(point.x) for point in points]
+        ys = [to_filtered_coordinate(point.y) for point in points]
+        queue = [(self.root, list(range(len(points))))]
+        push, pop = queue.append, queue.pop
+        while queue:
+            node, indices = pop()
+            for child, child_indices in node.distribute(points, xs, ys,
+                                                        indices, result):
+                if len(child_indices) > 1:
+                    push((child, child_indices))
+                elif child_indices:
+                    # no gain from grouping a single point
+                    index, = child_indices
+                    result[index] = child.locate(points[index])
+        return result
+
+    def locate_stream(self,
+                      points: Iterable[Point],
+                      *,
+                      chunk_size: int = 1024) -> Iterator[Location]:
+        """
+        Lazily finds locations of points relative to decomposed geometry.
+
+        Points are consumed by chunks which are located
+        with ``Graph.locate_many``,
+        so only a single chunk is held in memory at once.
+
+        Time complexity:
+            ``O(points_count * self.height)``
+        Memory complexity:
+            ``O(chunk_size)``
+
+        where ``points_count`` is the number of points.
+
+        :param points: points to locate.
+        :param chunk_size: number of points located at once.
+        :returns: iterator over locations of points.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+        ...                            context.polygon_cls)
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]),
+        ...             [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+        ...                       Point(4, 2)])]),
+        ...     context=context
+        ... )
+        >>> locations = graph.locate_stream(
+        ...     iter([Point(1, 1), Point(2, 2), Point(3, 3)]),
+        ...     chunk_size=2
+        ... )
+        >>> (list(locations)
+        ...  == [Location.INTERIOR, Location.BOUNDARY, Location.EXTERIOR])
+        True
+        """
+        assert chunk_size > 0, 'Chunk size should be positive.'
+        points = iter(points)
+        while True:
+            chunk = list(islice(points, chunk_size))
+            if not chunk:
+                break
+            yield from self.locate_many(chunk)
 
-    def __init__(self, root: Node) -> None:
+    def rebuild(self, *, shuffler: Shuffler = random.shuffle) -> None:
+        """
+        Rebuilds search structure in place
+        from decomposed edges which are not removed
+        within the same bounding box.
+
+        Time complexity:
+            ``O(edges_count * log edges_count)`` expected
+        Memory complexity:
+            ``O(edges_count)``
+
+        where ``edges_count`` is the number of decomposed edges.
+
+        :param shuffler:
+            function which mutates sequence by shuffling its elements,
+            required for randomization.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Multisegment, Point, Segment = (context.multisegment_cls,
+        ...                                 context.point_cls,
+        ...                                 context.segment_cls)
+        >>> graph = Graph.from_multisegment(
+        ...     Multisegment([Segment(Point(0, 0), Point(4, 0)),
+        ...                   Segment(Point(0, 2), Point(4, 2)),
+        ...                   Segment(Point(0, 4), Point(4, 4))]),
+        ...     context=context
+        ... )
+        >>> graph.remove(Segment(Point(0, 2), Point(4, 2)))
+        >>> len(list(graph.trapezoids()))
+        10
+        >>> graph.rebuild()
+        >>> len(list(graph.trapezoids()))
+        7
+        >>> graph.locate(Point(2, 2)) is Location.EXTERIOR
+        True
+        """
+        self._rebuild(shuffler)
+
+    def relate_segment(self, segment: Segment) -> Relation:
+        """
+        Finds relation between given segment and decomposed geometry.
+
+        Segment is traced through trapezoids it passes,
+        so only edges bounding these trapezoids are checked
+        against the segment.
+
+        Time complexity:
+            ``O((crossed_trapezoids_count + 1) * self.height)``
+        Memory complexity:
+            ``O(crossed_trapezoids_count)``
+
+        where ``crossed_trapezoids_count`` is the number of trapezoids
+        crossed by the segment.
+
+        :param segment: segment to check for.
+        :returns:
+            relation between the segment and decomposed geometry
+            in terms of ``orient.planar.segment_in_polygon``.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon, Segment = (context.contour_cls,
+        ...                                     context.point_cls,
+        ...                                     context.polygon_cls,
+        ...                                     context.segment_cls)
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+        ...                      Point(0, 4)]),
+        ...             [Contour([Point(1, 1), Point(1, 3), Point(3, 3),
+        ...                       Point(3, 1)])]),
+        ...     context=context
+        ... )
+        >>> (graph.relate_segment(Segment(Point(0, 0), Point(1, 0)))
+        ...  is Relation.COMPONENT)
+        True
+        >>> (graph.relate_segment(Segment(Point(1, 0), Point(0, 1)))
+        ...  is Relation.ENCLOSED)
+        True
+        >>> (graph.relate_segment(Segment(Point(2, 2), Point(6, 2)))
+        ...  is Relation.CROSS)
+        True
+        >>> (graph.relate_segment(Segment(Point(5, 0), Point(5, 4)))
+        ...  is Relation.DISJOINT)
+        True
+        """
+        start, end = segment.start, segment.end
+        if end < start:
+            start, end = end, start
+        bottom, top = to_bounding_edges(self.root)
+        context = bottom.context
+        clipped_endpoints = clip_segment_by_box(
+                start, end, bottom.left.x, bottom.left.y, top.right.x,
+                top.right.y, context
+        )
+        if clipped_endpoints is None:
+            return Relation.DISJOINT
+        clipped_start, clipped_end = clipped_endpoints
+        relater, segment_cls = context.segments_relation, context.segment_cls
+        crossings: Dict[int, Point] = {}
+        relations = {id(bottom): Relation.DISJOINT,
+                     id(top): Relation.DISJOINT}
+        cut_points = {clipped_start, clipped_end}
+        point = clipped_start
+        trapezoid = search_segment_trapezoid(self.root, point, end)
+        while True:
+            exit_point = None
+            for bound in (trapezoid.below, trapezoid.above):
+                bound_id = id(bound)
+                if bound_id not in relations:
+                    bound_segment = segment_cls(bound.left, bound.right)
+                    relation = relations[bound_id] = relater(segment,
+                                                             bound_segment)
+                    if (relation is Relation.CROSS
+                            or relation is Relation.TOUCH):
+                        intersection = context.segments_intersection(
+                                segment, bound_segment
+                        )
+                        cut_points.add(intersection)
+                        if relation is Relation.CROSS:
+                            crossings[bound_id] = intersection
+                    elif relation is not Relation.DISJOINT:
+                        cut_points.update(
+                                endpoint
+                                for endpoint in (bound.left, bound.right)
+                                if start <= endpoint <= end
+                        )
+                if bound_id in crossings:
+                    crossing_point = crossings[bound_id]
+                    if (point < crossing_point <= trapezoid.right
+                            and (exit_point is None
+                                 or crossing_point < exit_point)):
+                        exit_point = crossing_point
+            if exit_point is not None:
+                point = exit_point
+            elif clipped_end <= trapezoid.right:
+                break
+            else:
+                right_orientation = context.angle_orientation(
+                        start, end, trapezoid.right
+                )
+                if right_orientation is Orientation.COLLINEAR:
+                    point = trapezoid.right
+                else:
+                    candidate = (
+                        (trapezoid.upper_right or trapezoid.lower_right)
+                        if right_orientation is Orientation.CLOCKWISE
+                        else (trapezoid.lower_right or trapezoid.upper_right)
+                    )
+                    if candidate is None:
+                        # the end lies on the right side of the box
+                        break
+                    trapezoid = candidate
+                    continue
+            cut_points.add(point)
+            trapezoid = search_segment_trapezoid(self.root, point, end)
+        sorted_cut_points = sorted(cut_points)
+        pieces_locations = {
+            self.root.locate(context.segment_centroid(segment_cls(piece_start,
+                                                                  piece_end)))
+            for piece_start, piece_end in zip(sorted_cut_points,
+                                              sorted_cut_points[1:])
+        }
+        if clipped_endpoints != (start, end):
+            pieces_locations.add(Location.EXTERIOR)
+        has_contact = (Location.BOUNDARY in pieces_locations
+                       or any(self.root.locate(cut_point)
+                              is Location.BOUNDARY
+                              for cut_point in sorted_cut_points))
+        if Location.INTERIOR in pieces_locations:
+            return (Relation.CROSS
+                    if Location.EXTERIOR in pieces_locations
+                    else (Relation.ENCLOSED
+                          if has_contact
+                          else Relation.WITHIN))
+        elif Location.EXTERIOR in pieces_locations:
+            return Relation.TOUCH if has_contact else Relation.DISJOINT
+        else:
+            return Relation.COMPONENT
+
+    def remove(self,
+               segment: Segment,
+               *,
+               shuffler: Shuffler = random.shuffle) -> None:
+        """
+        Removes edge with given segment's endpoints
+        from the decomposition in place.
+
+        Edges which do not bound interior of decomposed polygons
+        are marked as removed and skipped by point location
+        while still splitting trapezoids,
+        search structure gets rebuilt from the remaining edges
+        within the same bounding box
+        once removed edges outnumber them.
+        Removal of polygons' edges rebuilds it right away,
+        since it changes location of whole regions.
+
+        Time complexity:
+            ``O(log edges_count)`` amortized expected
+            for edges without interior,
+            ``O(edges_count * log edges_count)`` expected otherwise
+        Memory complexity:
+            ``O(edges_count)``
+
+        where ``edges_count`` is the number of decomposed edges.
+
+        :param segment: segment to remove.
+        :param shuffler:
+            function which mutates sequence by shuffling its elements,
+            required for randomization on rebuilding.
+        :raises ValueError: if there is no edge for the segment.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Multisegment, Point, Segment = (context.multisegment_cls,
+        ...                                 context.point_cls,
+        ...                                 context.segment_cls)
+        >>> graph = Graph.from_multisegment(
+        ...     Multisegment([Segment(Point(0, 0), Point(4, 0)),
+        ...                   Segment(Point(0, 2), Point(4, 2)),
+        ...                   Segment(Point(0, 4), Point(4, 4))]),
+        ...     context=context
+        ... )
+        >>> graph.locate(Point(2, 2)) is Location.BOUNDARY
+        True
+        >>> graph.remove(Segment(Point(4, 2), Point(0, 2)))
+        >>> graph.locate(Point(2, 2)) is Location.EXTERIOR
+        True
+        >>> graph.locate(Point(0, 2)) is Location.EXTERIOR
+        True
+        >>> graph.remove(Segment(Point(4, 2), Point(0, 2)))
+        Traceback (most recent call last):
+            ...
+        ValueError: Segment is not found among decomposed edges.
+        """
+        self.remove_many([segment],
+                         shuffler=shuffler)
+
+    def remove_many(self,
+                    segments: Iterable[Segment],
+                    *,
+                    shuffler: Shuffler = random.shuffle) -> None:
+        """
+        Removes edges with given segments' endpoints
+        from the decomposition in place.
+
+        Edges are removed like with ``Graph.remove``,
+        but search structure is rebuilt at most once for all of them,
+        the graph stays unmodified if some of them are not found.
+
+        Time complexity:
+            ``O(segments_count * log edges_count)`` amortized expected
+            for edges without interior,
+            ``O(edges_count * log edges_count)`` expected otherwise
+        Memory complexity:
+            ``O(segments_count + edges_count)``
+
+        where ``segments_count`` is the number of removed segments,
+        ``edges_count`` is the number of decomposed edges.
+
+        :param segments: segments to remove.
+        :param shuffler:
+            function which mutates sequence by shuffling its elements,
+            required for randomization on rebuilding.
+        :raises ValueError: if there is no edge for some of the segments.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Multisegment, Point, Segment = (context.multisegment_cls,
+        ...                                 context.point_cls,
+        ...                                 context.segment_cls)
+        >>> graph = Graph.from_multisegment(
+        ...     Multisegment([Segment(Point(0, 0), Point(4, 0)),
+        ...                   Segment(Point(0, 2), Point(4, 2)),
+        ...                   Segment(Point(0, 4), Point(4, 4))]),
+        ...     context=context
+        ... )
+        >>> graph.remove_many([Segment(Point(0, 0), Point(4, 0)),
+        ...                    Segment(Point(0, 4), Point(4, 4))])
+        >>> graph.locate(Point(2, 0)) is Location.EXTERIOR
+        True
+        >>> graph.locate(Point(2, 2)) is Location.BOUNDARY
+        True
+        """
+        bottom, top = to_bounding_edges(self.root)
+        context = bottom.context
+        edges: Dict[int, Edge] = {}
+        bound_interior = False
+        for segment in segments:
+            start, end = segment.start, segment.end
+            if end < start:
+                start, end = end, start
+            trapezoid = (
+                search_edge_trapezoid(
+                        self.root,
+                        Edge.from_endpoints(start, end, False, context)
+                )
+                if start != end
+                else None
+            )
+            # the trapezoid lies right below the edge if it is present
+            edge = None if trapezoid is None else trapezoid.above
+            if (edge is None or edge is top or edge.removed
+                    or edge.left != start or edge.right != end
+                    or id(edge) in edges):
+                raise ValueError('Segment is not found '
+                                 'among decomposed edges.')
+            assert trapezoid is not None
+            edges[id(edge)] = edge
+            bound_interior = (bound_interior or edge.interior_to_left
+                              or trapezoid.component)
+        if not edges:
+            return
+        elif bound_interior:
+            self._rebuild(shuffler, edges.values())
+            return
+        endpoints_degrees = self._endpoints_degrees
+        if endpoints_degrees is None:
+            self._edges_count, endpoints_degrees = (
+                to_endpoints_degrees(self.root)
+            )
+            self._endpoints_degrees = endpoints_degrees
+        for edge in edges.values():
+            edge.removed = True
+            for endpoint in (edge.left, edge.right):
+                endpoints_degrees[endpoint] -= 1
+                if not endpoints_degrees[endpoint]:
+                    x_node = search_point_x_node(self.root, endpoint)
+                    assert x_node is not None, 'Endpoint is not found.'
+                    x_node.removed = True
+        self._edges_count -= len(edges)
+        self._removed_edges_count += len(edges)
+        self.modifications_count += 1
+        if self._removed_edges_count > self._edges_count:
+            self._rebuild(shuffler)
+
+    def trapezoids(self,
+                   *,
+                   components_only: bool = False) -> Iterator[Trapezoid]:
+        """
+        Returns iterator over trapezoids of the decomposition
+        without duplicates.
+
+        Trapezoids are enumerated by traversing the search structure,
+        since regions enclosed by edges are not reachable
+        from the others through trapezoids adjacency,
+        removed edges keep splitting trapezoids
+        until the graph is rebuilt with ``Graph.rebuild``.
+
+        Time complexity:
+            ``O(nodes_count)``
+        Memory complexity:
+            ``O(nodes_count)``
+
+        where ``nodes_count`` is the number of distinct nodes of the graph.
+
+        :param components_only:
+            flag which specifies whether to yield only trapezoids
+            which are components of decomposed geometry.
+        :returns: iterator over trapezoids.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+        ...                            context.polygon_cls)
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]), []),
+        ...     context=context
+        ... )
+        >>> len(list(graph.trapezoids()))
+        9
+        >>> sorted((trapezoid.left, trapezoid.right)
+        ...        for trapezoid in graph.trapezoids(components_only=True))
+        [(Point(0, 0), Point(0, 6)), (Point(0, 6), Point(6, 0)), \
+(Point(6, 0), Point(6, 6))]
+        """
+        visited = set()
+        queue = [self.root]
+        while queue:
+            node = queue.pop()
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            children = to_children(node)
+            if children:
+                queue.extend(reversed(children))
+            else:
+                assert isinstance(node, Leaf)
+                trapezoid = node.trapezoid
+                if not components_only or trapezoid.component:
+                    yield trapezoid
+
+    compacted: bool
+    modifications_count: int
+    permutation: Optional[Sequence[int]]
+    rebuilds_count: int
+    root: Node
+    _edges_count: int
+    _endpoints_degrees: Optional[Dict[Point, int]]
+    _removed_edges_count: int
+
+    __slots__ = ('compacted', 'modifications_count', 'permutation',
+                 'rebuilds_count', 'root', '_edges_count',
+                 '_endpoints_degrees', '_removed_edges_count')
+
+    def __init__(self,
+                 root: Node,
+                 rebuilds_count: int = 0,
+                 permutation: Optional[Sequence[int]] = None) -> None:
         """
         Initializes graph.
 
@@ -214,7 +1290,16 @@ class Graph:
         Memory complexity:
             ``O(1)``
         """
-        self.root = root
+        self.permutation, self.rebuilds_count, self.root = (
+            permutation, rebuilds_count, root
+        )
+        self.compacted = False
+        # incremented on every change of search structure & trapezoids
+        self.modifications_count = 0
+        # numbers of edges with each endpoint are counted
+        # on the first removal and dropped on rebuilding
+        self._edges_count, self._endpoints_degrees = 0, None
+        self._removed_edges_count = 0
 
     def __contains__(self, point: Point) -> bool:
         """
@@ -227,6 +1312,39 @@ class Graph:
         """
         return bool(self.root.locate(point))
 
+    def __reduce__(self) -> Tuple[Callable[..., Graph], Tuple[Any, ...]]:
+        """
+        Returns flat representation of the graph for pickling,
+        which preserves search structure & trapezoids adjacency
+        along with removed edges without recursing over nodes.
+
+        Time complexity:
+            ``O(nodes_count)``
+        Memory complexity:
+            ``O(nodes_count)``
+
+        where ``nodes_count`` is the number of distinct nodes of the graph.
+
+        >>> import pickle
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+        ...                            context.polygon_cls)
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]), []),
+        ...     context=context
+        ... )
+        >>> restored = pickle.loads(pickle.dumps(graph))
+        >>> restored.height == graph.height
+        True
+        >>> restored.locate(Point(1, 1)) is Location.INTERIOR
+        True
+        """
+        return type(self)._from_raw, (pack_root(self.root),
+                                      self.rebuilds_count,
+                                      self.permutation)
+
     __repr__ = generate_repr(__init__)
 
     @classmethod
@@ -234,23 +1352,121 @@ class Graph:
                              box: Box,
                              edges: List[Edge],
                              shuffler: Shuffler,
+                             seed: Optional[int],
+                             max_height_factor: Optional[float],
+                             max_rebuilds_count: int,
                              context: Context) -> Graph:
-        shuffler(edges)
-        edges_iterator = iter(edges)
+        if seed is not None:
+            shuffler = random.Random(seed).shuffle
+        result = cls._from_box_with_shuffled_edges(box, edges, shuffler,
+                                                   context)
+        if max_height_factor is None:
+            return result
+        max_height = max_height_factor * log2(len(edges) + 1)
+        rebuilds_count = 0
+        while (result.height > max_height
+               and rebuilds_count < max_rebuilds_count):
+            rebuilds_count += 1
+            candidate = cls._from_box_with_shuffled_edges(box, edges,
+                                                          shuffler, context)
+            if candidate.height < result.height:
+                result = candidate
+        result.rebuilds_count = rebuilds_count
+        return result
+
+    @classmethod
+    def _from_box_with_shuffled_edges(cls,
+                                      box: Box,
+                                      edges: List[Edge],
+                                      shuffler: Shuffler,
+                                      context: Context) -> Graph:
+        edges_indices = {id(edge): index for index, edge in enumerate(edges)}
+        shuffled_edges = edges[:]
+        shuffler(shuffled_edges)
+        permutation = [edges_indices[id(edge)] for edge in shuffled_edges]
+        edges_iterator = iter(shuffled_edges)
         result = cls(
                 to_single_trapezoid_node_replacement(
                         box_to_leaf(box, context).trapezoid,
                         next(edges_iterator)
-                )
+                ),
+                permutation=permutation
         )
         for edge in edges_iterator:
             add_edge(result, edge)
         return result
 
+    @classmethod
+    def _from_raw(cls,
+                  raw: RawGraph,
+                  rebuilds_count: int,
+                  permutation: Optional[Sequence[int]]) -> Graph:
+        result = cls(unpack_root(*raw), rebuilds_count, permutation)
+        result._removed_edges_count = sum(
+                edge.removed for edge in to_edges(result.root)
+        )
+        if result._removed_edges_count:
+            result._edges_count, result._endpoints_degrees = (
+                to_endpoints_degrees(result.root)
+            )
+        return result
+
+    def _rebuild(self,
+                 shuffler: Shuffler,
+                 excluded_edges: Iterable[Edge] = ()) -> None:
+        excluded_ids = {id(edge) for edge in excluded_edges}
+        edges = [edge
+                 for edge in to_live_edges(self.root)
+                 if id(edge) not in excluded_ids]
+        shuffler(edges)
+        bottom, top = to_bounding_edges(self.root)
+        leaf = Leaf(bottom.left, bottom.right, bottom, top)
+        self.root = (to_single_trapezoid_node_replacement(leaf.trapezoid,
+                                                          edges[0])
+                     if edges
+                     else leaf)
+        self.compacted, self.permutation = False, None
+        self._edges_count, self._endpoints_degrees = 0, None
+        self._removed_edges_count = 0
+        self.modifications_count += 1
+        for edge in islice(edges, 1, None):
+            add_edge(self, edge)
+
 
 def add_edge(graph: Graph, edge: Edge) -> None:
     assert graph.height > 0
-    trapezoids = find_intersecting_trapezoids(graph, edge)
+    add_edge_to_trapezoids(edge, find_intersecting_trapezoids(graph, edge))
+
+
+def add_checked_edge(graph: Graph, edge: Edge) -> None:
+    first_trapezoid = search_edge_trapezoid(graph.root, edge)
+    if first_trapezoid is None:
+        raise ValueError('Segment should meet decomposed edges '
+                         'only at endpoints.')
+    trapezoids = []
+    # each trapezoid is checked before moving to the next one
+    # since the walk relies on the edge not crossing others
+    for trapezoid in to_edge_trapezoids(first_trapezoid, edge):
+        if not (edges_meet_properly(edge, trapezoid.below)
+                and edges_meet_properly(edge, trapezoid.above)):
+            raise ValueError('Segment should meet decomposed edges '
+                             'only at endpoints.')
+        elif trapezoid.component:
+            raise ValueError('Segment should not cross interior '
+                             'of decomposed polygons.')
+        trapezoids.append(trapezoid)
+    if graph.compacted:
+        restore_parents(graph.root)
+        graph.compacted = False
+    if isinstance(graph.root, Leaf):
+        graph.root = to_single_trapezoid_node_replacement(trapezoids[0],
+                                                          edge)
+    else:
+        add_edge_to_trapezoids(edge, trapezoids)
+    graph.permutation = None
+
+
+def add_edge_to_trapezoids(edge: Edge, trapezoids: List[Trapezoid]) -> None:
     first_trapezoid = trapezoids[0]
     if len(trapezoids) == 1:
         replacement_node = to_single_trapezoid_node_replacement(
@@ -385,6 +1601,36 @@ def add_edge_to_middle_trapezoid(
     return above, below
 
 
+def polygon_to_edges(polygon: Polygon,
+                     owner: int,
+                     context: Context) -> List[Edge]:
+    border = polygon.border
+    orienteer = context.angle_orientation
+    is_border_positively_oriented = (to_contour_orientation(border, orienteer)
+                                     is Orientation.COUNTERCLOCKWISE)
+    result = [
+        Edge.from_endpoints(start, end, is_border_positively_oriented,
+                            context, owner)
+        if start < end
+        else Edge.from_endpoints(end, start, not is_border_positively_oriented,
+                                 context, owner)
+        for start, end in contour_to_edges_endpoints(border)
+    ]
+    for hole in polygon.holes:
+        is_hole_negatively_oriented = (to_contour_orientation(hole, orienteer)
+                                       is Orientation.CLOCKWISE)
+        result.extend(
+                Edge.from_endpoints(start, end, is_hole_negatively_oriented,
+                                    context, owner)
+                if start < end
+                else Edge.from_endpoints(end, start,
+                                         not is_hole_negatively_oriented,
+                                         context, owner)
+                for start, end in contour_to_edges_endpoints(hole)
+        )
+    return result
+
+
 def to_single_trapezoid_node_replacement(trapezoid: Trapezoid,
                                          edge: Edge) -> Node:
     above_node, below_node = (
@@ -421,6 +1667,125 @@ def to_single_trapezoid_node_replacement(trapezoid: Trapezoid,
     return result
 
 
+def search_segment_trapezoid(root: Node,
+                             start: Point,
+                             end: Point) -> Trapezoid:
+    """
+    Searches for the trapezoid which contains points of the segment
+    lying right after its start.
+    """
+    node = root
+    while not isinstance(node, Leaf):
+        if isinstance(node, XNode):
+            node = node.left if start < node.point else node.right
+        else:
+            assert isinstance(node, YNode)
+            orientation = node.edge.orientation_of(start)
+            if orientation is Orientation.COLLINEAR:
+                orientation = node.edge.orientation_of(end)
+            node = (node.below
+                    if orientation is Orientation.CLOCKWISE
+                    else node.above)
+    return node.trapezoid
+
+
+def search_edge_trapezoid(root: Node, edge: Edge) -> Optional[Trapezoid]:
+    """
+    Searches for the trapezoid which contains the left endpoint of the edge,
+    returns ``None`` if the edge crosses some of decomposed edges on the way.
+    """
+    node = root
+    while not isinstance(node, Leaf):
+        if isinstance(node, XNode):
+            node = node.right if node.point <= edge.left else node.left
+        else:
+            assert isinstance(node, YNode)
+            is_above = node.edge.__lt__(edge)
+            if is_above is NotImplemented:
+                # crossing edges are incomparable
+                return None
+            node = node.above if is_above else node.below
+    return node.trapezoid
+
+
+def search_point_x_node(root: Node, point: Point) -> Optional[XNode]:
+    """
+    Searches for the node which splits the structure by given endpoint.
+    """
+    node = root
+    while not isinstance(node, Leaf):
+        if isinstance(node, XNode):
+            if node.point == point:
+                return node
+            node = node.left if point < node.point else node.right
+        else:
+            assert isinstance(node, YNode)
+            orientation = node.edge.orientation_of(point)
+            if orientation is Orientation.COLLINEAR:
+                return None
+            node = (node.below
+                    if orientation is Orientation.CLOCKWISE
+                    else node.above)
+    return None
+
+
+def to_edges(root: Node) -> List[Edge]:
+    """
+    Returns decomposed edges (including removed ones)
+    without bounding box edges.
+    """
+    bottom, top = to_bounding_edges(root)
+    edges = {id(edge): edge
+             for edge in flatten((node.trapezoid.below, node.trapezoid.above)
+                                 for node in to_nodes(root)
+                                 if isinstance(node, Leaf))}
+    del edges[id(bottom)], edges[id(top)]
+    return list(edges.values())
+
+
+def to_endpoints_degrees(root: Node) -> Tuple[int, Dict[Point, int]]:
+    """
+    Returns number of decomposed edges which are not removed
+    along with numbers of such edges with each endpoint,
+    which are zeros for endpoints of removed edges only.
+    """
+    edges = to_edges(root)
+    live_edges = [edge for edge in edges if not edge.removed]
+    result: Dict[Point, int] = Counter(
+            flatten((edge.left, edge.right) for edge in live_edges)
+    )
+    for edge in edges:
+        if edge.removed:
+            result.setdefault(edge.left, 0)
+            result.setdefault(edge.right, 0)
+    return len(live_edges), result
+
+
+def to_live_edges(root: Node) -> List[Edge]:
+    """
+    Returns decomposed edges which are not removed
+    without bounding box edges.
+    """
+    return [edge for edge in to_edges(root) if not edge.removed]
+
+
+def to_bounding_edges(root: Node) -> Tuple[Edge, Edge]:
+    lowest, highest = root, root
+    while not isinstance(lowest, Leaf):
+        if isinstance(lowest, XNode):
+            lowest = lowest.left
+        else:
+            assert isinstance(lowest, YNode)
+            lowest = lowest.below
+    while not isinstance(highest, Leaf):
+        if isinstance(highest, XNode):
+            highest = highest.right
+        else:
+            assert isinstance(highest, YNode)
+            highest = highest.above
+    return lowest.below, highest.above
+
+
 def box_to_leaf(box: Box, context: Context) -> Leaf:
     min_x, min_y, max_x, max_y = box.min_x, box.min_y, box.max_x, box.max_y
     delta_x, delta_y = max_x - min_x, max_y - min_y
@@ -436,9 +1801,103 @@ def box_to_leaf(box: Box, context: Context) -> Leaf:
                                     point_cls(max_x, max_y), True, context))
 
 
+def clip_segment_by_box(start: Point,
+                        end: Point,
+                        min_x: Scalar,
+                        min_y: Scalar,
+                        max_x: Scalar,
+                        max_y: Scalar,
+                        context: Context) -> Optional[Tuple[Point, Point]]:
+    if (min_x < start.x < max_x and min_y < start.y < max_y
+            and min_x < end.x < max_x and min_y < end.y < max_y):
+        return start, end
+    point_cls, segment_cls = context.point_cls, context.segment_cls
+    segment = segment_cls(start, end)
+    points = [point
+              for point in (start, end)
+              if min_x <= point.x <= max_x and min_y <= point.y <= max_y]
+    for side_start, side_end in [
+        (point_cls(min_x, min_y), point_cls(max_x, min_y)),
+        (point_cls(max_x, min_y), point_cls(max_x, max_y)),
+        (point_cls(min_x, max_y), point_cls(max_x, max_y)),
+        (point_cls(min_x, min_y), point_cls(min_x, max_y))
+    ]:
+        side = segment_cls(side_start, side_end)
+        relation = context.segments_relation(segment, side)
+        if relation is Relation.CROSS or relation is Relation.TOUCH:
+            points.append(context.segments_intersection(segment, side))
+        elif relation is not Relation.DISJOINT:
+            # segment lies on the side, so it is exterior
+            return None
+    if not points:
+        return None
+    result_start, result_end = min(points), max(points)
+    return ((result_start, result_end)
+            if result_start != result_end
+            else None)
+
+
+def edges_meet_properly(first: Edge, second: Edge) -> bool:
+    context = first.context
+    segment_cls = context.segment_cls
+    relation = context.segments_relation(
+            segment_cls(first.left, first.right),
+            segment_cls(second.left, second.right)
+    )
+    return (relation is Relation.DISJOINT
+            or (relation is Relation.TOUCH
+                and (first.left == second.left or first.left == second.right
+                     or first.right == second.left
+                     or first.right == second.right)))
+
+
+def to_components_moments(graph: Graph) -> Tuple[Scalar, Scalar, Scalar]:
+    """
+    Returns doubled area & first moments multiplied by six
+    of components of the graph.
+    """
+    lower_edges: Dict[int, Edge] = {}
+    upper_edges: Dict[int, Edge] = {}
+    for trapezoid in graph.trapezoids(components_only=True):
+        lower_edges[id(trapezoid.below)] = trapezoid.below
+        upper_edges[id(trapezoid.above)] = trapezoid.above
+    exact = (to_bounding_edges(graph.root)[0].context.mode
+             is Mode.EXACT)
+    double_area = x_numerator = y_numerator = 0
+    for edges, sign in ((upper_edges.values(), 1),
+                        (lower_edges.values(), -1)):
+        for edge in edges:
+            start_x, start_y, end_x, end_y = (edge.left.x, edge.left.y,
+                                              edge.right.x, edge.right.y)
+            if exact:
+                start_x, start_y, end_x, end_y = (
+                    Fraction(start_x), Fraction(start_y), Fraction(end_x),
+                    Fraction(end_y)
+                )
+            width = sign * (end_x - start_x)
+            double_area += width * (start_y + end_y)
+            x_numerator += width * (start_x * (2 * start_y + end_y)
+                                    + end_x * (start_y + 2 * end_y))
+            y_numerator += width * (start_y * start_y + start_y * end_y
+                                    + end_y * end_y)
+    return double_area, x_numerator, y_numerator
+
+
 def find_intersecting_trapezoids(graph: Graph, edge: Edge) -> List[Trapezoid]:
-    trapezoid = graph.root.search_edge(edge)
-    result = [trapezoid]
+    return list(to_intersecting_trapezoids(graph.root, edge))
+
+
+def to_intersecting_trapezoids(root: Node, edge: Edge) -> Iterator[Trapezoid]:
+    return to_edge_trapezoids(root.search_edge(edge), edge)
+
+
+def to_edge_trapezoids(trapezoid: Trapezoid,
+                       edge: Edge) -> Iterator[Trapezoid]:
+    """
+    Returns trapezoids crossed by the edge
+    starting from the one which contains its left endpoint.
+    """
+    yield trapezoid
     right = edge.right
     while trapezoid.right < right:
         candidate = ((trapezoid.upper_right or trapezoid.lower_right)
@@ -448,5 +1907,4 @@ def find_intersecting_trapezoids(graph: Graph, edge: Edge) -> List[Trapezoid]:
         assert candidate is not None, ('Expected neighbour trapezoid, '
                                        'but none found.')
         trapezoid = candidate
-        result.append(trapezoid)
-    return result
+        yield trapezoid
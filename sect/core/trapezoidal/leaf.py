@@ -1,3 +1,8 @@
+from typing import (List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
 from ground.base import Location
 from ground.hints import Point
 from reprit.base import generate_repr
@@ -16,10 +21,6 @@ class Leaf(Node):
     def below(self) -> Edge:
         return self.trapezoid.below
 
-    @property
-    def height(self) -> int:
-        return 0
-
     @property
     def left(self) -> Point:
         return self.trapezoid.left
@@ -28,6 +29,19 @@ class Leaf(Node):
     def right(self) -> Point:
         return self.trapezoid.right
 
+    def distribute(self,
+                   points: Sequence[Point],
+                   xs: Sequence[float],
+                   ys: Sequence[float],
+                   indices: List[int],
+                   locations: List[Location]) -> List[Tuple[Node, List[int]]]:
+        location = (Location.INTERIOR
+                    if self.trapezoid.component
+                    else Location.EXTERIOR)
+        for index in indices:
+            locations[index] = location
+        return []
+
     def locate(self, point: Point) -> Location:
         return (Location.INTERIOR
                 if self.trapezoid.component
@@ -36,6 +50,9 @@ class Leaf(Node):
     def search_edge(self, edge: Edge) -> Trapezoid:
         return self.trapezoid
 
+    def search_point(self, point: Point) -> Optional[Trapezoid]:
+        return self.trapezoid
+
     __slots__ = 'trapezoid',
 
     def __init__(self,
@@ -43,10 +60,19 @@ class Leaf(Node):
                  right: Point,
                  below: Edge,
                  above: Edge) -> None:
-        super().__init__()
+        super().__init__(0)
         self.trapezoid = Trapezoid(left, right, below, above, self)
 
     __repr__ = generate_repr(__init__)
 
     def _replace_child(self, current: Node, replacement: Node) -> None:
         raise TypeError('Leaf has no children.')
+
+    def _to_edge_child(self, edge: Edge) -> Node:
+        raise TypeError('Leaf has no children.')
+
+    def _to_height(self) -> int:
+        return 0
+
+    def _to_point_child(self, point: Point) -> Optional[Node]:
+        raise TypeError('Leaf has no children.')
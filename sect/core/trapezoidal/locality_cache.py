@@ -0,0 +1,129 @@
+from typing import Optional
+
+from ground.base import (Location,
+                         Orientation)
+from ground.hints import Point
+from reprit.base import generate_repr
+
+from .graph import Graph
+from .trapezoid import Trapezoid
+
+
+class LocalityCache:
+    """
+    Represents point locator over decomposition graph
+    which remembers the last found trapezoid
+    and checks it with its right & left neighbours
+    before searching from the root,
+    which pays off for spatially coherent sequences of points.
+
+    Remembered trapezoid is dropped once the graph gets modified.
+    """
+
+    __slots__ = 'graph', 'hits', 'misses', '_modifications_count', '_trapezoid'
+
+    def __init__(self, graph: Graph) -> None:
+        """
+        Initializes cache.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+        """
+        self.graph, self.hits, self.misses = graph, 0, 0
+        self._modifications_count = graph.modifications_count
+        self._trapezoid: Optional[Trapezoid] = None
+
+    __repr__ = generate_repr(__init__)
+
+    def __contains__(self, point: Point) -> bool:
+        """
+        Checks if point is contained in decomposed geometry.
+
+        Time complexity:
+            ``O(1)`` for hits, ``O(self.graph.height)`` for misses
+        Memory complexity:
+            ``O(1)``
+        """
+        return bool(self.locate(point))
+
+    def clear(self) -> None:
+        """
+        Forgets the last found trapezoid and resets counters.
+
+        Time complexity:
+            ``O(1)``
+        Memory complexity:
+            ``O(1)``
+        """
+        self.hits = self.misses = 0
+        self._trapezoid = None
+
+    def locate(self, point: Point) -> Location:
+        """
+        Finds location of point relative to decomposed geometry.
+
+        Time complexity:
+            ``O(1)`` for hits, ``O(self.graph.height)`` for misses
+        Memory complexity:
+            ``O(1)``
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+        ...                            context.polygon_cls)
+        >>> graph = Graph.from_polygon(
+        ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+        ...                      Point(0, 6)]), []),
+        ...     context=context
+        ... )
+        >>> cache = LocalityCache(graph)
+        >>> cache.locate(Point(1, 1)) is Location.INTERIOR
+        True
+        >>> cache.locate(Point(2, 1)) is Location.INTERIOR
+        True
+        >>> cache.locate(Point(3, 0)) is Location.BOUNDARY
+        True
+        >>> cache.hits, cache.misses
+        (1, 2)
+        >>> cache.locate(Point(2, 7)) is Location.EXTERIOR
+        True
+        >>> Segment = context.segment_cls
+        >>> graph.insert(Segment(Point(1, 7), Point(3, 7)))
+        >>> cache.locate(Point(2, 7)) is Location.BOUNDARY
+        True
+        >>> cache.hits, cache.misses
+        (1, 4)
+        """
+        if self._modifications_count != self.graph.modifications_count:
+            self._modifications_count = self.graph.modifications_count
+            self._trapezoid = None
+        trapezoid = self._trapezoid
+        if trapezoid is not None:
+            for candidate in (trapezoid, trapezoid.upper_right,
+                              trapezoid.lower_right, trapezoid.upper_left,
+                              trapezoid.lower_left):
+                if (candidate is not None
+                        and trapezoid_contains_point(candidate, point)):
+                    self.hits += 1
+                    self._trapezoid = candidate
+                    return (Location.INTERIOR
+                            if candidate.component
+                            else Location.EXTERIOR)
+        self.misses += 1
+        trapezoid = self.graph.find_trapezoid(point)
+        if trapezoid is None:
+            return Location.BOUNDARY
+        self._trapezoid = trapezoid
+        return (Location.INTERIOR
+                if trapezoid.component
+                else Location.EXTERIOR)
+
+
+def trapezoid_contains_point(trapezoid: Trapezoid, point: Point) -> bool:
+    return (trapezoid.left < point < trapezoid.right
+            and (trapezoid.below.orientation_of(point)
+                 is Orientation.COUNTERCLOCKWISE)
+            and (trapezoid.above.orientation_of(point)
+                 is Orientation.CLOCKWISE))
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from abc import (ABC,
                  abstractmethod)
-from typing import List
+from typing import (List,
+                    Optional,
+                    Sequence,
+                    Tuple)
 
 from ground.base import Location
 from ground.hints import Point
@@ -12,25 +15,56 @@ from .trapezoid import Trapezoid
 
 
 class Node(ABC):
-    @property
     @abstractmethod
-    def height(self) -> int:
+    def distribute(self,
+                   points: Sequence[Point],
+                   xs: Sequence[float],
+                   ys: Sequence[float],
+                   indices: List[int],
+                   locations: List[Location]) -> List[Tuple[Node, List[int]]]:
         """
-        Returns height of the node.
+        Distributes points with given indices between children nodes,
+        setting locations of the points which are resolved by the node.
+
+        ``xs`` & ``ys`` hold floating point coordinates of the points
+        for filtered orientation tests with NaN for not representable ones.
         """
 
-    @abstractmethod
     def locate(self, point: Point) -> Location:
         """
         Finds location of given point relative to the contour.
         """
+        node = self
+        # only leaves have zero height
+        while node.height:
+            child = node._to_point_child(point)
+            if child is None:
+                return Location.BOUNDARY
+            node = child
+        return node.locate(point)
+
+    def search_point(self, point: Point) -> Optional[Trapezoid]:
+        """
+        Searches for the trapezoid which contains given point
+        in its interior, returns ``None`` for points on the boundary.
+        """
+        node = self
+        while node.height:
+            child = node._to_point_child(point)
+            if child is None:
+                return None
+            node = child
+        return node.search_point(point)
 
-    @abstractmethod
     def search_edge(self, edge: Edge) -> Trapezoid:
         """
-        Recursive search for the trapezoid
+        Searches for the trapezoid
         which contains the left endpoint of the given segment.
         """
+        node = self
+        while node.height:
+            node = node._to_edge_child(edge)
+        return node.search_edge(edge)
 
     def replace_with(self, other: Node) -> None:
         """
@@ -39,12 +73,14 @@ class Node(ABC):
         for parent in self._parents:
             parent._replace_child(self, other)
             other._add_parent(parent)
+            parent._update_height()
         self._parents.clear()
 
-    __slots__ = '_parents',
+    __slots__ = '_parents', 'height'
 
-    def __init__(self) -> None:
+    def __init__(self, height: int) -> None:
         self._parents: List[Node] = []
+        self.height = height
 
     def _add_parent(self, parent: Node) -> None:
         self._parents.append(parent)
@@ -54,3 +90,34 @@ class Node(ABC):
         """
         Replaces child node with given one.
         """
+
+    @abstractmethod
+    def _to_edge_child(self, edge: Edge) -> Node:
+        """
+        Returns child node which contains the left endpoint of given edge.
+        """
+
+    @abstractmethod
+    def _to_height(self) -> int:
+        """
+        Calculates height of the node from heights of its children.
+        """
+
+    @abstractmethod
+    def _to_point_child(self, point: Point) -> Optional[Node]:
+        """
+        Returns child node which contains given point,
+        ``None`` if the point lies on the boundary.
+        """
+
+    def _update_height(self) -> None:
+        """
+        Updates height of the node and propagates it to ancestors.
+        """
+        queue = [self]
+        while queue:
+            node = queue.pop()
+            height = node._to_height()
+            if height != node.height:
+                node.height = height
+                queue.extend(node._parents)
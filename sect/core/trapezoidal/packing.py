@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from array import array
+from typing import (Dict,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
+from ground.base import Context
+from ground.hints import Point
+
+from .edge import Edge
+from .frozen_graph import (X_NODE_KIND,
+                           Y_NODE_KIND)
+from .leaf import Leaf
+from .node import Node
+from .trapezoid import Trapezoid
+from .utils import to_post_ordered_nodes
+from .x_node import XNode
+from .y_node import YNode
+
+TRAPEZOID_FIELDS_COUNT = 8
+RawGraph = Tuple[Context, List[Point], 'array[int]', 'array[int]',
+                 'array[int]', 'array[int]', 'array[int]', 'array[int]',
+                 'array[int]', 'array[int]', 'array[int]', 'array[int]']
+
+
+def pack_root(root: Node) -> RawGraph:
+    """
+    Packs search structure with given root into flat sequences.
+
+    Nodes are stored in post-order, so children precede their parents
+    and the root is the last one.
+    Edges are stored as indices of their endpoints,
+    interior flags, owners and removal flags,
+    x-nodes additionally hold removal flags.
+    Leaves' payloads hold indices of their trapezoids,
+    each trapezoid is stored as indices of its left & right points,
+    below & above edges and lower left, lower right, upper left
+    & upper right neighbours (``-1`` for missing).
+    """
+    nodes = to_post_ordered_nodes(root)
+    points: List[Point] = []
+    points_indices: Dict[Point, int] = {}
+    edges_indices: Dict[int, int] = {}
+    endpoints, interiors_to_left, owners, edges_removals = (
+        array('l'), array('B'), array('l'), array('B')
+    )
+    trapezoids_indices: Dict[int, int] = {}
+    context: Optional[Context] = None
+
+    def to_point_index(point: Point) -> int:
+        try:
+            return points_indices[point]
+        except KeyError:
+            result = points_indices[point] = len(points)
+            points.append(point)
+            return result
+
+    def to_edge_index(edge: Edge) -> int:
+        try:
+            return edges_indices[id(edge)]
+        except KeyError:
+            result = edges_indices[id(edge)] = len(interiors_to_left)
+            endpoints.extend((to_point_index(edge.left),
+                              to_point_index(edge.right)))
+            interiors_to_left.append(edge.interior_to_left)
+            owners.append(edge.owner)
+            edges_removals.append(edge.removed)
+            return result
+
+    def to_trapezoid_index(trapezoid: Optional[Trapezoid]) -> int:
+        return -1 if trapezoid is None else trapezoids_indices[id(trapezoid)]
+
+    nodes_count = len(nodes)
+    kinds, nodes_removals = (array('B', bytes(nodes_count)),
+                             array('B', bytes(nodes_count)))
+    firsts, seconds, payloads = (array('l', [0]) * nodes_count,
+                                 array('l', [0]) * nodes_count,
+                                 array('l', [0]) * nodes_count)
+    nodes_indices = {id(node): index for index, node in enumerate(nodes)}
+    trapezoids: List[Trapezoid] = []
+    for index, node in enumerate(nodes):
+        if isinstance(node, XNode):
+            kinds[index] = X_NODE_KIND
+            firsts[index] = nodes_indices[id(node.left)]
+            seconds[index] = nodes_indices[id(node.right)]
+            payloads[index] = to_point_index(node.point)
+            nodes_removals[index] = node.removed
+        elif isinstance(node, YNode):
+            kinds[index] = Y_NODE_KIND
+            firsts[index] = nodes_indices[id(node.below)]
+            seconds[index] = nodes_indices[id(node.above)]
+            payloads[index] = to_edge_index(node.edge)
+        else:
+            assert isinstance(node, Leaf)
+            trapezoid = node.trapezoid
+            payloads[index] = trapezoids_indices[id(trapezoid)] = len(
+                    trapezoids
+            )
+            trapezoids.append(trapezoid)
+            context = trapezoid.below.context
+    assert context is not None
+    trapezoids_data = array('l')
+    for trapezoid in trapezoids:
+        trapezoids_data.extend((to_point_index(trapezoid.left),
+                                to_point_index(trapezoid.right),
+                                to_edge_index(trapezoid.below),
+                                to_edge_index(trapezoid.above),
+                                to_trapezoid_index(trapezoid.lower_left),
+                                to_trapezoid_index(trapezoid.lower_right),
+                                to_trapezoid_index(trapezoid.upper_left),
+                                to_trapezoid_index(trapezoid.upper_right)))
+    return (context, points, endpoints, interiors_to_left, owners,
+            edges_removals, kinds, firsts, seconds, payloads, nodes_removals,
+            trapezoids_data)
+
+
+def unpack_root(context: Context,
+                points: Sequence[Point],
+                endpoints: array[int],
+                interiors_to_left: array[int],
+                owners: array[int],
+                edges_removals: array[int],
+                kinds: array[int],
+                firsts: array[int],
+                seconds: array[int],
+                payloads: array[int],
+                nodes_removals: array[int],
+                trapezoids_data: array[int]) -> Node:
+    """
+    Restores search structure from flat sequences produced by ``pack_root``
+    and returns its root.
+    """
+    edges = [Edge.from_endpoints(points[endpoints[2 * index]],
+                                 points[endpoints[2 * index + 1]],
+                                 bool(interior_to_left), context, owner)
+             for index, (interior_to_left, owner)
+             in enumerate(zip(interiors_to_left, owners))]
+    for edge, removed in zip(edges, edges_removals):
+        edge.removed = bool(removed)
+    leaves = [Leaf(points[trapezoids_data[offset]],
+                   points[trapezoids_data[offset + 1]],
+                   edges[trapezoids_data[offset + 2]],
+                   edges[trapezoids_data[offset + 3]])
+              for offset in range(0, len(trapezoids_data),
+                                  TRAPEZOID_FIELDS_COUNT)]
+    for leaf, offset in zip(leaves, range(0, len(trapezoids_data),
+                                          TRAPEZOID_FIELDS_COUNT)):
+        (lower_left_index, lower_right_index, upper_left_index,
+         upper_right_index) = trapezoids_data[offset + 4:offset + 8]
+        trapezoid = leaf.trapezoid
+        trapezoid.lower_left = to_trapezoid(leaves, lower_left_index)
+        trapezoid.lower_right = to_trapezoid(leaves, lower_right_index)
+        trapezoid.upper_left = to_trapezoid(leaves, upper_left_index)
+        trapezoid.upper_right = to_trapezoid(leaves, upper_right_index)
+    nodes: List[Node] = []
+    for kind, first, second, payload, removed in zip(kinds, firsts, seconds,
+                                                     payloads, nodes_removals):
+        if kind == X_NODE_KIND:
+            x_node = XNode(points[payload], nodes[first], nodes[second])
+            x_node.removed = bool(removed)
+            nodes.append(x_node)
+        else:
+            nodes.append(YNode(edges[payload], nodes[first], nodes[second])
+                         if kind == Y_NODE_KIND
+                         else leaves[payload])
+    return nodes[-1]
+
+
+def to_trapezoid(leaves: Sequence[Leaf], index: int) -> Optional[Trapezoid]:
+    return None if index < 0 else leaves[index].trapezoid
@@ -0,0 +1,90 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import (List,
+                    Optional,
+                    Sequence,
+                    Union)
+
+from ground.base import Location
+from ground.hints import Point
+
+from .frozen_graph import FrozenGraph
+from .graph import Graph
+
+_graph: Optional[Union[FrozenGraph, Graph]] = None
+
+
+def locate_parallel(graph: Union[FrozenGraph, Graph],
+                    points: Sequence[Point],
+                    *,
+                    workers: Optional[int] = None,
+                    chunk_size: Optional[int] = None) -> List[Location]:
+    """
+    Finds locations of points relative to decomposed geometry
+    using pool of processes.
+
+    Graph is sent to each of the workers once on their start
+    (inherited without serialization where processes are forked),
+    points are split into contiguous chunks
+    which are located by workers in parallel,
+    results are returned in the order of points.
+
+    Time complexity:
+        ``O(len(points) * graph.height / workers + nodes_count * workers)``
+    Memory complexity:
+        ``O(len(points) + nodes_count * workers)``
+
+    where ``nodes_count`` is the number of distinct nodes of the graph.
+
+    :param graph: decomposition graph to locate points in.
+    :param points: points to locate.
+    :param workers:
+        number of worker processes, defaults to the number of processors.
+    :param chunk_size:
+        number of points located by a worker at once,
+        defaults to the value giving four chunks per worker.
+    :returns: locations of points.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+    ...                            context.polygon_cls)
+    >>> graph = Graph.from_polygon(
+    ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+    ...                      Point(0, 6)]),
+    ...             [Contour([Point(2, 2), Point(2, 4), Point(4, 4),
+    ...                       Point(4, 2)])]),
+    ...     context=context
+    ... )
+    >>> (locate_parallel(graph, [Point(1, 1), Point(2, 2), Point(3, 3)],
+    ...                  workers=2)
+    ...  == [Location.INTERIOR, Location.BOUNDARY, Location.EXTERIOR])
+    True
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    assert workers > 0, 'Workers count should be positive.'
+    if workers == 1 or len(points) <= 1:
+        return graph.locate_many(points)
+    if chunk_size is None:
+        chunk_size = -(-len(points) // (4 * workers))
+    assert chunk_size > 0, 'Chunk size should be positive.'
+    chunks = [points[offset:offset + chunk_size]
+              for offset in range(0, len(points), chunk_size)]
+    result: List[Location] = []
+    with ProcessPoolExecutor(min(workers, len(chunks)),
+                             initializer=initialize_worker,
+                             initargs=(graph,)) as executor:
+        for chunk_result in executor.map(locate_chunk, chunks):
+            result.extend(chunk_result)
+    return result
+
+
+def initialize_worker(graph: Union[FrozenGraph, Graph]) -> None:
+    global _graph
+    _graph = graph
+
+
+def locate_chunk(points: Sequence[Point]) -> List[Location]:
+    assert _graph is not None, 'Worker is not initialized.'
+    return _graph.locate_many(points)
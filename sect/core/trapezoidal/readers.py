@@ -0,0 +1,92 @@
+import csv
+import struct
+from typing import (BinaryIO,
+                    Iterator,
+                    TextIO)
+
+from ground.base import Context
+from ground.hints import Point
+
+BINARY_POINT_FORMAT = struct.Struct('<dd')
+
+
+def read_binary_points(file: BinaryIO,
+                       *,
+                       chunk_size: int = 4096,
+                       context: Context) -> Iterator[Point]:
+    """
+    Lazily reads points from binary file
+    with coordinates stored as consecutive pairs of little-endian doubles.
+
+    Time complexity:
+        ``O(points_count)``
+    Memory complexity:
+        ``O(chunk_size)``
+
+    where ``points_count`` is the number of points in the file.
+
+    :param file: binary file to read from.
+    :param chunk_size: number of points read from the file at once.
+    :param context: geometric context.
+    :returns: iterator over points.
+
+    >>> import io
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Point = context.point_cls
+    >>> file = io.BytesIO(BINARY_POINT_FORMAT.pack(1., 2.)
+    ...                   + BINARY_POINT_FORMAT.pack(3., 4.))
+    >>> list(read_binary_points(file,
+    ...                         context=context)) == [Point(1., 2.),
+    ...                                               Point(3., 4.)]
+    True
+    """
+    assert chunk_size > 0, 'Chunk size should be positive.'
+    point_cls, point_size = context.point_cls, BINARY_POINT_FORMAT.size
+    chunk_bytes_count = chunk_size * point_size
+    while True:
+        chunk = file.read(chunk_bytes_count)
+        if len(chunk) % point_size:
+            raise ValueError('File size should be a multiple '
+                             'of {} bytes.'.format(point_size))
+        for x, y in BINARY_POINT_FORMAT.iter_unpack(chunk):
+            yield point_cls(x, y)
+        if len(chunk) < chunk_bytes_count:
+            break
+
+
+def read_csv_points(file: TextIO,
+                    *,
+                    delimiter: str = ',',
+                    context: Context) -> Iterator[Point]:
+    """
+    Lazily reads points from CSV file
+    with abscissas & ordinates in the first two columns of rows.
+
+    Time complexity:
+        ``O(points_count)``
+    Memory complexity:
+        ``O(1)``
+
+    where ``points_count`` is the number of points in the file.
+
+    :param file: text file to read from.
+    :param delimiter: separator of columns.
+    :param context: geometric context.
+    :returns: iterator over points.
+
+    >>> import io
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Point = context.point_cls
+    >>> file = io.StringIO('1,2\\n3.5,4\\n')
+    >>> list(read_csv_points(file,
+    ...                      context=context)) == [Point(1., 2.),
+    ...                                            Point(3.5, 4.)]
+    True
+    """
+    point_cls = context.point_cls
+    for row in csv.reader(file,
+                          delimiter=delimiter):
+        if row:
+            yield point_cls(float(row[0]), float(row[1]))
@@ -0,0 +1,178 @@
+import random
+from typing import (MutableSequence,
+                    Optional,
+                    Sequence,
+                    Tuple,
+                    TypeVar)
+
+from ground.hints import (Point,
+                          Segment)
+from reprit.base import generate_repr
+
+from sect.core.hints import Domain
+from .edge import Edge
+
+HILBERT_CURVE_ORDER = 16
+EdgeOrSegment = TypeVar('EdgeOrSegment', Edge, Segment)
+
+
+class PermutationShuffler:
+    """
+    Represents shuffler which rearranges elements of sequence
+    according to given permutation,
+    so that the element with index ``permutation[index]``
+    gets placed at ``index``.
+
+    Can be used for reproducing decomposition graph
+    from its ``permutation`` attribute.
+
+    >>> from ground.base import get_context
+    >>> from sect.decomposition import Graph
+    >>> context = get_context()
+    >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+    ...                            context.polygon_cls)
+    >>> polygon = Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+    ...                            Point(0, 6)]), [])
+    >>> graph = Graph.from_polygon(polygon,
+    ...                            context=context)
+    >>> reproduced_graph = Graph.from_polygon(
+    ...     polygon,
+    ...     shuffler=PermutationShuffler(graph.permutation),
+    ...     context=context
+    ... )
+    >>> reproduced_graph.permutation == graph.permutation
+    True
+    >>> reproduced_graph.depth_stats() == graph.depth_stats()
+    True
+    """
+
+    __slots__ = 'permutation',
+
+    def __init__(self, permutation: Sequence[int]) -> None:
+        self.permutation = permutation
+
+    __repr__ = generate_repr(__init__)
+
+    def __call__(self, sequence: MutableSequence[Domain]) -> None:
+        """
+        Rearranges elements of given sequence in place.
+
+        Time complexity:
+            ``O(len(sequence))``
+        Memory complexity:
+            ``O(len(sequence))``
+        """
+        permutation = self.permutation
+        assert len(sequence) == len(permutation), (
+            'Permutation should have the same length as the sequence.'
+        )
+        sequence[:] = [sequence[index] for index in permutation]
+
+
+class BrioShuffler:
+    """
+    Represents shuffler of decomposition edges (or segments)
+    which produces biased randomized insertion order (BRIO):
+    edges are randomly split into rounds of geometrically growing sizes
+    and edges of each round are ordered along Hilbert curve
+    by their midpoints,
+    so consecutively inserted edges are close to each other
+    while expected complexity of construction stays the same
+    as for uniformly random order.
+
+    Reference:
+        https://doi.org/10.1145/336154.336207
+
+    >>> from ground.base import get_context
+    >>> from sect.decomposition import Graph
+    >>> context = get_context()
+    >>> Contour, Point, Polygon, Segment = (context.contour_cls,
+    ...                                     context.point_cls,
+    ...                                     context.polygon_cls,
+    ...                                     context.segment_cls)
+    >>> graph = Graph.from_polygon(
+    ...     Polygon(Contour([Point(0, 0), Point(6, 0), Point(6, 6),
+    ...                      Point(0, 6)]), []),
+    ...     shuffler=BrioShuffler(seed=0),
+    ...     context=context
+    ... )
+    >>> Point(1, 1) in graph
+    True
+    >>> graph.insert_many([Segment(Point(0, 7), Point(6, 7)),
+    ...                    Segment(Point(7, 0), Point(7, 6))],
+    ...                   shuffler=BrioShuffler(seed=0))
+    >>> Point(3, 7) in graph
+    True
+    """
+
+    __slots__ = 'seed', '_random'
+
+    def __init__(self, *, seed: Optional[int] = None) -> None:
+        self.seed = seed
+        self._random = random.Random(seed)
+
+    __repr__ = generate_repr(__init__)
+
+    def __call__(self, edges: MutableSequence[EdgeOrSegment]) -> None:
+        """
+        Rearranges edges (or segments) in place.
+
+        Time complexity:
+            ``O(len(edges) * log len(edges))``
+        Memory complexity:
+            ``O(len(edges))``
+        """
+        if not edges:
+            return
+        midpoints = [((float(start.x) + float(end.x)) / 2,
+                      (float(start.y) + float(end.y)) / 2)
+                     for start, end in map(to_endpoints, edges)]
+        min_x = min(x for x, _ in midpoints)
+        min_y = min(y for _, y in midpoints)
+        scale = max(max(x for x, _ in midpoints) - min_x,
+                    max(y for _, y in midpoints) - min_y) or 1.
+        grid_size = 1 << HILBERT_CURVE_ORDER
+        grid_max_coordinate = grid_size - 1
+        max_round = max(len(edges).bit_length() - 1, 0)
+        to_random = self._random.random
+        keys = []
+        for index, (x, y) in enumerate(midpoints):
+            round_ = 0
+            while round_ < max_round and to_random() < 0.5:
+                round_ += 1
+            keys.append((-round_,
+                         to_hilbert_index(
+                                 int((x - min_x) / scale
+                                     * grid_max_coordinate),
+                                 int((y - min_y) / scale
+                                     * grid_max_coordinate),
+                                 grid_size
+                         ),
+                         index))
+        keys.sort()
+        edges[:] = [edges[index] for _, _, index in keys]
+
+
+def to_endpoints(edge: EdgeOrSegment) -> Tuple[Point, Point]:
+    return ((edge.left, edge.right)
+            if isinstance(edge, Edge)
+            else (edge.start, edge.end))
+
+
+def to_hilbert_index(x: int, y: int, grid_size: int) -> int:
+    """
+    Returns index of the cell with given coordinates
+    along Hilbert curve filling square grid of given size
+    which is a power of two.
+    """
+    result = 0
+    step = grid_size >> 1
+    while step:
+        x_bit, y_bit = int(x & step > 0), int(y & step > 0)
+        result += step * step * ((3 * x_bit) ^ y_bit)
+        if not y_bit:
+            if x_bit:
+                x, y = step - 1 - x, step - 1 - y
+            x, y = y, x
+        step >>= 1
+    return result
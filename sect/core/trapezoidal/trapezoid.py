@@ -12,6 +12,12 @@ if TYPE_CHECKING:
 
 
 class Trapezoid:
+    """
+    Represents trapezoid of decomposition
+    bounded by ``below`` & ``above`` edges
+    and vertical lines through ``left`` & ``right`` points.
+    """
+
     @property
     def component(self) -> bool:
         """
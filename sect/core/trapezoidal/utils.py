@@ -0,0 +1,61 @@
+from typing import (List,
+                    Sequence)
+
+from .node import Node
+from .x_node import XNode
+from .y_node import YNode
+
+
+def release_parents(root: Node) -> None:
+    for node in to_nodes(root):
+        del node._parents
+
+
+def restore_parents(root: Node) -> None:
+    nodes = to_nodes(root)
+    for node in nodes:
+        node._parents = []
+    for node in nodes:
+        for child in to_children(node):
+            child._add_parent(node)
+
+
+def to_children(node: Node) -> Sequence[Node]:
+    return ((node.left, node.right)
+            if isinstance(node, XNode)
+            else ((node.below, node.above)
+                  if isinstance(node, YNode)
+                  else ()))
+
+
+def to_nodes(root: Node) -> List[Node]:
+    result = []
+    visited = set()
+    queue = [root]
+    while queue:
+        node = queue.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        result.append(node)
+        queue.extend(reversed(to_children(node)))
+    return result
+
+
+def to_post_ordered_nodes(root: Node) -> List[Node]:
+    result = []
+    visited = set()
+    queue = [(root, False)]
+    while queue:
+        node, is_expanded = queue.pop()
+        if is_expanded:
+            result.append(node)
+            continue
+        elif id(node) in visited:
+            continue
+        visited.add(id(node))
+        queue.append((node, True))
+        queue.extend((child, False)
+                     for child in reversed(to_children(node))
+                     if id(child) not in visited)
+    return result
@@ -1,34 +1,46 @@
+from typing import (List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
 from ground.base import Location
 from ground.hints import Point
 from reprit.base import generate_repr
 
 from .edge import Edge
 from .node import Node
-from .trapezoid import Trapezoid
 
 
 class XNode(Node):
-    @property
-    def height(self) -> int:
-        return max(self.left.height, self.right.height) + 1
-
-    def locate(self, point: Point) -> Location:
-        return (self.left.locate(point)
-                if point < self.point
-                else (self.right.locate(point)
-                      if self.point < point
-                      else Location.BOUNDARY))
-
-    def search_edge(self, edge: Edge) -> Trapezoid:
-        return (self.right
-                if self.point <= edge.left
-                else self.left).search_edge(edge)
+    def distribute(self,
+                   points: Sequence[Point],
+                   xs: Sequence[float],
+                   ys: Sequence[float],
+                   indices: List[int],
+                   locations: List[Location]) -> List[Tuple[Node, List[int]]]:
+        left_indices: List[int] = []
+        right_indices: List[int] = []
+        add_left_index, add_right_index, node_point, removed = (
+            left_indices.append, right_indices.append, self.point,
+            self.removed
+        )
+        for index in indices:
+            point = points[index]
+            if point < node_point:
+                add_left_index(index)
+            elif node_point < point or removed:
+                add_right_index(index)
+            else:
+                locations[index] = Location.BOUNDARY
+        return [(self.left, left_indices), (self.right, right_indices)]
 
-    __slots__ = 'left', 'point', 'right'
+    __slots__ = 'left', 'point', 'removed', 'right'
 
     def __init__(self, point: Point, left: Node, right: Node) -> None:
-        super().__init__()
+        super().__init__(max(left.height, right.height) + 1)
         self.left, self.point, self.right = left, point, right
+        # set when all edges with the point are removed
+        self.removed = False
         self.left._add_parent(self)
         self.right._add_parent(self)
 
@@ -39,3 +51,16 @@ class XNode(Node):
             self.left = replacement
         else:
             self.right = replacement
+
+    def _to_edge_child(self, edge: Edge) -> Node:
+        return self.right if self.point <= edge.left else self.left
+
+    def _to_height(self) -> int:
+        return max(self.left.height, self.right.height) + 1
+
+    def _to_point_child(self, point: Point) -> Optional[Node]:
+        return (self.left
+                if point < self.point
+                else (self.right
+                      if self.point < point or self.removed
+                      else None))
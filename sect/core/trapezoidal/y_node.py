@@ -1,35 +1,83 @@
+import math
+from typing import (List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
 from ground.base import (Location,
                          Orientation)
-from ground.hints import Point
+from ground.hints import (Point,
+                          Scalar)
 from reprit.base import generate_repr
 
 from .edge import Edge
 from .node import Node
-from .trapezoid import Trapezoid
 
+# relative error bound of floating point orientation determinant
+# by J. R. Shewchuk, see https://doi.org/10.1007/PL00009321
+ORIENTATION_ERROR_BOUND = (3. + 16. * 2. ** -53) * 2. ** -53
 
-class YNode(Node):
-    @property
-    def height(self) -> int:
-        return max(self.below.height, self.above.height) + 1
 
-    def locate(self, point: Point) -> Location:
-        point_orientation = self.edge.orientation_of(point)
-        return (self.above.locate(point)
-                if point_orientation is Orientation.COUNTERCLOCKWISE
-                else (self.below.locate(point)
-                      if point_orientation is Orientation.CLOCKWISE
-                      else Location.BOUNDARY))
+def to_filtered_coordinate(value: Scalar) -> float:
+    """
+    Converts coordinate to float for filtered orientation tests,
+    with NaN for values not representable by floats.
+    """
+    try:
+        result = float(value)
+    except OverflowError:
+        return math.nan
+    return result if result == value else math.nan
+
 
-    def search_edge(self, edge: Edge) -> Trapezoid:
-        return (self.above
-                if self.edge < edge
-                else self.below).search_edge(edge)
+class YNode(Node):
+    def distribute(self,
+                   points: Sequence[Point],
+                   xs: Sequence[float],
+                   ys: Sequence[float],
+                   indices: List[int],
+                   locations: List[Location]) -> List[Tuple[Node, List[int]]]:
+        below_indices: List[int] = []
+        above_indices: List[int] = []
+        add_below_index, add_above_index = (below_indices.append,
+                                            above_indices.append)
+        edge = self.edge
+        edge_left, edge_right, orienteer = (edge.left, edge.right,
+                                            edge.context.angle_orientation)
+        left_x, left_y, right_x, right_y = (
+            to_filtered_coordinate(edge_left.x),
+            to_filtered_coordinate(edge_left.y),
+            to_filtered_coordinate(edge_right.x),
+            to_filtered_coordinate(edge_right.y)
+        )
+        for index in indices:
+            x, y = xs[index], ys[index]
+            minuend = (left_x - x) * (right_y - y)
+            subtrahend = (left_y - y) * (right_x - x)
+            determinant = minuend - subtrahend
+            # comparison with NaN is false, so such cases are not filtered
+            if (abs(determinant)
+                    > ORIENTATION_ERROR_BOUND
+                    * (abs(minuend) + abs(subtrahend))):
+                (add_above_index
+                 if determinant > 0
+                 else add_below_index)(index)
+                continue
+            point_orientation = orienteer(edge_left, edge_right,
+                                          points[index])
+            if point_orientation is Orientation.CLOCKWISE:
+                add_below_index(index)
+            elif (point_orientation is Orientation.COUNTERCLOCKWISE
+                  or edge.removed):
+                add_above_index(index)
+            else:
+                locations[index] = Location.BOUNDARY
+        return [(self.below, below_indices), (self.above, above_indices)]
 
     __slots__ = 'above', 'below', 'edge'
 
     def __init__(self, edge: Edge, below: Node, above: Node) -> None:
-        super().__init__()
+        super().__init__(max(below.height, above.height) + 1)
         self.above, self.below, self.edge = above, below, edge
         self.above._add_parent(self)
         self.below._add_parent(self)
@@ -41,3 +89,18 @@ class YNode(Node):
             self.below = replacement
         else:
             self.above = replacement
+
+    def _to_edge_child(self, edge: Edge) -> Node:
+        return self.above if self.edge < edge else self.below
+
+    def _to_height(self) -> int:
+        return max(self.below.height, self.above.height) + 1
+
+    def _to_point_child(self, point: Point) -> Optional[Node]:
+        point_orientation = self.edge.orientation_of(point)
+        return (self.below
+                if point_orientation is Orientation.CLOCKWISE
+                else (self.above
+                      if (point_orientation is Orientation.COUNTERCLOCKWISE
+                          or self.edge.removed)
+                      else None))
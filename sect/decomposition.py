@@ -1,5 +1,27 @@
+from .core.trapezoidal.depth_stats import DepthStats as _DepthStats
+from .core.trapezoidal.edge import Edge as _Edge
+from .core.trapezoidal.frozen_graph import FrozenGraph as _FrozenGraph
 from .core.trapezoidal.graph import Graph as _Graph
 from .core.trapezoidal.hints import Shuffler as _Shuffler
+from .core.trapezoidal.locality_cache import LocalityCache as _LocalityCache
+from .core.trapezoidal.parallel import locate_parallel as _locate_parallel
+from .core.trapezoidal.readers import (read_binary_points
+                                       as _read_binary_points,
+                                       read_csv_points as _read_csv_points)
+from .core.trapezoidal.shuffling import (BrioShuffler as _BrioShuffler,
+                                         PermutationShuffler
+                                         as _PermutationShuffler)
+from .core.trapezoidal.trapezoid import Trapezoid as _Trapezoid
 
+BrioShuffler = _BrioShuffler
+DepthStats = _DepthStats
+Edge = _Edge
+FrozenGraph = _FrozenGraph
 Graph = _Graph
+LocalityCache = _LocalityCache
+PermutationShuffler = _PermutationShuffler
 Shuffler = _Shuffler
+Trapezoid = _Trapezoid
+locate_parallel = _locate_parallel
+read_binary_points = _read_binary_points
+read_csv_points = _read_csv_points
@@ -1,5 +1,11 @@
 from .core.delaunay.quad_edge import QuadEdge as _QuadEdge
+from .core.delaunay.quad_edges_store import (
+    QuadEdgesStore as _QuadEdgesStore,
+    StoredQuadEdge as _StoredQuadEdge
+)
 from .core.delaunay.triangulation import Triangulation as _Triangulation
 
 QuadEdge = _QuadEdge
+QuadEdgesStore = _QuadEdgesStore
+StoredQuadEdge = _StoredQuadEdge
 Triangulation = _Triangulation
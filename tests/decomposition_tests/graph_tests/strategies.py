@@ -1,5 +1,6 @@
 from functools import partial
-from typing import Tuple
+from typing import (List,
+                    Tuple)
 
 from ground.base import get_context
 from ground.hints import Scalar
@@ -7,15 +8,48 @@ from hypothesis import strategies
 from hypothesis_geometry import planar
 
 from tests.strategies import coordinates_strategies
-from tests.utils import (Multisegment,
+from tests.utils import (Multipolygon,
+                         Multisegment,
                          Point,
                          Polygon,
+                         Segment,
                          Strategy)
 
 contexts = strategies.just(get_context())
+multipolygons = coordinates_strategies.flatmap(planar.multipolygons)
+
+
+def to_multipolygons_with_points(coordinates: Strategy[Scalar]
+                                 ) -> Strategy[Tuple[Multipolygon, Point]]:
+    return strategies.tuples(planar.multipolygons(coordinates),
+                             planar.points(coordinates))
+
+
+multipolygons_with_points = (coordinates_strategies
+                             .flatmap(to_multipolygons_with_points))
+
+
+def to_multipolygons_with_segments(coordinates: Strategy[Scalar]
+                                   ) -> Strategy[Tuple[Multipolygon, Segment]]:
+    return strategies.tuples(planar.multipolygons(coordinates),
+                             planar.segments(coordinates))
+
+
+multipolygons_with_segments = (coordinates_strategies
+                               .flatmap(to_multipolygons_with_segments))
 multisegments = coordinates_strategies.flatmap(planar.multisegments)
 
 
+def to_multisegments_with_segments(coordinates: Strategy[Scalar]
+                                   ) -> Strategy[Tuple[Multisegment, Segment]]:
+    return strategies.tuples(planar.multisegments(coordinates),
+                             planar.segments(coordinates))
+
+
+multisegments_with_segments = (coordinates_strategies
+                               .flatmap(to_multisegments_with_segments))
+
+
 def to_multisegments_with_points(coordinates: Strategy[Scalar]
                                  ) -> Strategy[Tuple[Multisegment, Point]]:
     return strategies.tuples(planar.multisegments(coordinates),
@@ -24,6 +58,18 @@ def to_multisegments_with_points(coordinates: Strategy[Scalar]
 
 multisegments_with_points = (coordinates_strategies
                              .flatmap(to_multisegments_with_points))
+
+
+def to_multisegments_with_points_lists(
+        coordinates: Strategy[Scalar]
+) -> Strategy[Tuple[Multisegment, List[Point]]]:
+    return strategies.tuples(planar.multisegments(coordinates),
+                             strategies.lists(planar.points(coordinates)))
+
+
+multisegments_with_points_lists = (
+    coordinates_strategies.flatmap(to_multisegments_with_points_lists)
+)
 polygons = coordinates_strategies.flatmap(planar.polygons)
 
 
@@ -34,3 +80,37 @@ def to_polygons_with_points(coordinates: Strategy[Scalar]
 
 
 polygons_with_points = coordinates_strategies.flatmap(to_polygons_with_points)
+
+
+def to_polygons_with_segments(coordinates: Strategy[Scalar]
+                              ) -> Strategy[Tuple[Polygon, Segment]]:
+    return strategies.tuples(planar.polygons(coordinates),
+                             planar.segments(coordinates))
+
+
+polygons_with_segments = (coordinates_strategies
+                          .flatmap(to_polygons_with_segments))
+
+
+def to_polygons_with_segments_and_points_lists(
+        coordinates: Strategy[Scalar]
+) -> Strategy[Tuple[Polygon, Segment, List[Point]]]:
+    return strategies.tuples(planar.polygons(coordinates),
+                             planar.segments(coordinates),
+                             strategies.lists(planar.points(coordinates)))
+
+
+polygons_with_segments_and_points_lists = (
+    coordinates_strategies.flatmap(to_polygons_with_segments_and_points_lists)
+)
+
+
+def to_polygons_with_points_lists(coordinates: Strategy[Scalar]
+                                  ) -> Strategy[Tuple[Polygon, List[Point]]]:
+    return strategies.tuples(planar.polygons(coordinates),
+                             strategies.lists(planar.points(coordinates)))
+
+
+polygons_with_points_lists = (coordinates_strategies
+                              .flatmap(to_polygons_with_points_lists))
+seeds = strategies.integers()
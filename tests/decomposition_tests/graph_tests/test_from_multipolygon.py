@@ -0,0 +1,99 @@
+from typing import Tuple
+
+from ground.base import (Context,
+                         Location)
+from ground.hints import (Point,
+                          Segment)
+from hypothesis import given
+from orient.planar import (point_in_multipolygon,
+                           point_in_polygon,
+                           segment_in_multipolygon)
+
+from sect.decomposition import Graph
+from tests.utils import Multipolygon
+from . import strategies
+
+
+@given(strategies.contexts, strategies.multipolygons)
+def test_basic(context: Context, multipolygon: Multipolygon) -> None:
+    result = Graph.from_multipolygon(multipolygon,
+                                     context=context)
+
+    assert isinstance(result, Graph)
+
+
+@given(strategies.contexts, strategies.multipolygons)
+def test_area(context: Context, multipolygon: Multipolygon) -> None:
+    result = Graph.from_multipolygon(multipolygon,
+                                     context=context)
+
+    assert result.area() == sum(
+            abs(context.region_signed_area(polygon.border))
+            - sum(abs(context.region_signed_area(hole))
+                  for hole in polygon.holes)
+            for polygon in multipolygon.polygons
+    )
+
+
+@given(strategies.contexts, strategies.multipolygons)
+def test_centroid(context: Context, multipolygon: Multipolygon) -> None:
+    result = Graph.from_multipolygon(multipolygon,
+                                     context=context)
+
+    assert result.centroid() == context.multipolygon_centroid(multipolygon)
+
+
+@given(strategies.contexts, strategies.multipolygons_with_points)
+def test_contains(context: Context,
+                  multipolygon_with_point: Tuple[Multipolygon, Point]) -> None:
+    multipolygon, point = multipolygon_with_point
+
+    result = Graph.from_multipolygon(multipolygon,
+                                     context=context)
+
+    assert ((point in result)
+            is (point_in_multipolygon(point, multipolygon)
+                is not Location.EXTERIOR))
+
+
+@given(strategies.contexts, strategies.multipolygons_with_points)
+def test_find_polygon_index(context: Context,
+                            multipolygon_with_point: Tuple[Multipolygon,
+                                                           Point]) -> None:
+    multipolygon, point = multipolygon_with_point
+
+    result = Graph.from_multipolygon(multipolygon,
+                                     context=context)
+
+    polygon_index = result.find_polygon_index(point)
+    assert (polygon_index is None
+            or (point_in_polygon(point, multipolygon.polygons[polygon_index])
+                is Location.INTERIOR))
+    assert ((polygon_index is None)
+            is (point_in_multipolygon(point, multipolygon)
+                is not Location.INTERIOR))
+
+
+@given(strategies.contexts, strategies.multipolygons_with_points)
+def test_locate(context: Context,
+                multipolygon_with_point: Tuple[Multipolygon, Point]) -> None:
+    multipolygon, point = multipolygon_with_point
+
+    result = Graph.from_multipolygon(multipolygon,
+                                     context=context)
+
+    assert result.locate(point) is point_in_multipolygon(point, multipolygon)
+
+
+@given(strategies.contexts, strategies.multipolygons_with_segments)
+def test_relate_segment(
+        context: Context,
+        multipolygon_with_segment: Tuple[Multipolygon, Segment]
+) -> None:
+    multipolygon, segment = multipolygon_with_segment
+    graph = Graph.from_multipolygon(multipolygon,
+                                    context=context)
+
+    result = graph.relate_segment(segment)
+
+    assert result is segment_in_multipolygon(segment, multipolygon)
@@ -1,5 +1,10 @@
-from typing import Tuple
+import pickle
+import sys
+from math import log2
+from typing import (List,
+                    Tuple)
 
+import pytest
 from ground.base import (Context,
                          Location)
 from ground.hints import (Multisegment,
@@ -7,7 +12,13 @@ from ground.hints import (Multisegment,
 from hypothesis import given
 from orient.planar import point_in_multisegment
 
-from sect.decomposition import Graph
+from sect.decomposition import (BrioShuffler,
+                                DepthStats,
+                                FrozenGraph,
+                                Graph,
+                                LocalityCache,
+                                Trapezoid)
+from tests.utils import Multisegment as MultisegmentCls
 from . import strategies
 
 
@@ -39,6 +50,181 @@ def test_contains(context: Context,
                                  is not Location.EXTERIOR)
 
 
+@given(strategies.contexts, strategies.multisegments_with_points_lists)
+def test_contains_many(context: Context,
+                       multisegment_with_points: Tuple[Multisegment,
+                                                       List[Point]]) -> None:
+    multisegment, points = multisegment_with_points
+
+    result = Graph.from_multisegment(multisegment,
+                                     context=context)
+
+    assert result.contains_many(points) == [point in result
+                                            for point in points]
+
+
+@given(strategies.contexts, strategies.multisegments_with_points_lists)
+def test_compact(context: Context,
+                 multisegment_with_points: Tuple[Multisegment, List[Point]]
+                 ) -> None:
+    multisegment, points = multisegment_with_points
+    first_segment, *rest_segments = multisegment.segments
+    graph = Graph.from_multisegment(MultisegmentCls([first_segment]),
+                                    context=context)
+    inserted_segments = [first_segment]
+
+    for segment in rest_segments:
+        graph.compact()
+        assert graph.compacted
+        try:
+            graph.insert(segment)
+        except ValueError:
+            continue
+        assert not graph.compacted
+        inserted_segments.append(segment)
+    graph.compact()
+
+    inserted_multisegment = MultisegmentCls(inserted_segments)
+    assert graph.locate_many(points) == [
+        point_in_multisegment(point, inserted_multisegment)
+        for point in points
+    ]
+
+
+@given(strategies.contexts)
+def test_deep(context: Context) -> None:
+    point_cls, segment_cls = context.point_cls, context.segment_cls
+    segments_count = sys.getrecursionlimit() // 2 + 1
+    multisegment = MultisegmentCls([
+        segment_cls(point_cls(0, index), point_cls(1, index))
+        for index in range(segments_count)
+    ])
+
+    result = Graph.from_multisegment(multisegment,
+                                     shuffler=lambda edges: None,
+                                     context=context)
+
+    assert result.height > sys.getrecursionlimit()
+    assert result.locate(point_cls(0, segments_count - 1)) is Location.BOUNDARY
+    assert result.find_trapezoid(point_cls(0, segments_count)) is not None
+
+
+@given(strategies.contexts, strategies.multisegments)
+def test_depth_stats(context: Context, multisegment: Multisegment) -> None:
+    graph = Graph.from_multisegment(multisegment,
+                                    context=context)
+
+    result = graph.depth_stats()
+
+    assert isinstance(result, DepthStats)
+    assert result.height == graph.height
+    assert 0 < result.min_leaf_depth <= result.mean_leaf_depth <= result.height
+    assert 0 < result.leaves_count < result.nodes_count
+
+
+@given(strategies.contexts, strategies.multisegments_with_points)
+def test_find_trapezoid(context: Context,
+                        multisegment_with_point: Tuple[Multisegment,
+                                                       Point]) -> None:
+    multisegment, point = multisegment_with_point
+    graph = Graph.from_multisegment(multisegment,
+                                    context=context)
+
+    result = graph.find_trapezoid(point)
+
+    assert (result is None) is (graph.locate(point) is Location.BOUNDARY)
+    assert result is None or isinstance(result, Trapezoid)
+    assert (result is None
+            or (result.component
+                is (graph.locate(point) is Location.INTERIOR)))
+
+
+@given(strategies.contexts, strategies.multisegments_with_points)
+def test_freeze(context: Context,
+                multisegment_with_point: Tuple[Multisegment, Point]) -> None:
+    multisegment, point = multisegment_with_point
+    graph = Graph.from_multisegment(multisegment,
+                                    context=context)
+
+    result = graph.freeze()
+
+    assert isinstance(result, FrozenGraph)
+    assert result.height == graph.height
+    assert result.locate(point) is graph.locate(point)
+    assert (point in result) is (point in graph)
+
+
+@given(strategies.contexts, strategies.multisegments_with_points_lists)
+def test_insert(context: Context,
+                multisegment_with_points: Tuple[Multisegment, List[Point]]
+                ) -> None:
+    multisegment, points = multisegment_with_points
+    first_segment, *rest_segments = multisegment.segments
+    graph = Graph.from_multisegment(MultisegmentCls([first_segment]),
+                                    context=context)
+    inserted_segments = [first_segment]
+
+    for segment in rest_segments:
+        try:
+            graph.insert(segment)
+        except ValueError:
+            continue
+        inserted_segments.append(segment)
+
+    inserted_multisegment = MultisegmentCls(inserted_segments)
+    assert graph.locate_many(points) == [
+        point_in_multisegment(point, inserted_multisegment)
+        for point in points
+    ]
+
+
+@given(strategies.contexts, strategies.multisegments_with_points_lists,
+       strategies.seeds)
+def test_insert_many_brio_shuffled(
+        context: Context,
+        multisegment_with_points: Tuple[Multisegment, List[Point]],
+        seed: int
+) -> None:
+    multisegment, points = multisegment_with_points
+    graph = Graph.from_multisegment(multisegment,
+                                    context=context)
+    removed_segments = multisegment.segments[::2]
+    graph.remove_many(removed_segments)
+
+    graph.insert_many(removed_segments,
+                      shuffler=BrioShuffler(seed=seed))
+
+    assert graph.locate_many(points) == [
+        point_in_multisegment(point, multisegment) for point in points
+    ]
+
+
+@given(strategies.contexts, strategies.multisegments)
+def test_insert_existing(context: Context, multisegment: Multisegment) -> None:
+    graph = Graph.from_multisegment(multisegment,
+                                    context=context)
+
+    for segment in multisegment.segments:
+        with pytest.raises(ValueError):
+            graph.insert(segment)
+
+
+@given(strategies.contexts, strategies.multisegments)
+def test_max_height_factor(context: Context,
+                           multisegment: Multisegment) -> None:
+    max_height_factor, max_rebuilds_count = 4, 3
+
+    result = Graph.from_multisegment(multisegment,
+                                     max_height_factor=max_height_factor,
+                                     max_rebuilds_count=max_rebuilds_count,
+                                     context=context)
+
+    edges_count = len(multisegment.segments)
+    assert 0 <= result.rebuilds_count <= max_rebuilds_count
+    assert (result.rebuilds_count == max_rebuilds_count
+            or result.height <= max_height_factor * log2(edges_count + 1))
+
+
 @given(strategies.contexts, strategies.multisegments_with_points)
 def test_locate(context: Context,
                 multisegment_with_point: Tuple[Multisegment, Point]) -> None:
@@ -48,3 +234,169 @@ def test_locate(context: Context,
                                      context=context)
 
     assert result.locate(point) is point_in_multisegment(point, multisegment)
+
+
+@given(strategies.contexts, strategies.multisegments_with_points_lists)
+def test_locate_array(context: Context,
+                      multisegment_with_points: Tuple[Multisegment,
+                                                      List[Point]]) -> None:
+    multisegment, points = multisegment_with_points
+    points = points + [segment.start for segment in multisegment.segments]
+    graph = Graph.from_multisegment(multisegment,
+                                    context=context)
+    frozen_graph = graph.freeze()
+    xs, ys = ([float(point.x) for point in points],
+              [float(point.y) for point in points])
+
+    result = frozen_graph.locate_array(xs, ys)
+
+    assert result == [graph.locate(context.point_cls(x, y))
+                      for x, y in zip(xs, ys)]
+
+
+@given(strategies.contexts, strategies.multisegments_with_points_lists)
+def test_locality_cache(context: Context,
+                        multisegment_with_points: Tuple[Multisegment,
+                                                        List[Point]]) -> None:
+    multisegment, points = multisegment_with_points
+    graph = Graph.from_multisegment(multisegment,
+                                    context=context)
+    cache = LocalityCache(graph)
+    points = sorted(points)
+
+    result = [cache.locate(point) for point in points]
+
+    assert result == graph.locate_many(points)
+    assert cache.hits + cache.misses == len(points)
+
+
+@given(strategies.contexts, strategies.multisegments_with_points_lists)
+def test_locality_cache_modified(context: Context,
+                                 multisegment_with_points: Tuple[Multisegment,
+                                                                 List[Point]]
+                                 ) -> None:
+    multisegment, points = multisegment_with_points
+    graph = Graph.from_multisegment(multisegment,
+                                    context=context)
+    removed_segments = multisegment.segments[::2]
+    graph.remove_many(removed_segments)
+    cache = LocalityCache(graph)
+    points = sorted(points + [context.segment_centroid(segment)
+                              for segment in removed_segments])
+    for point in points:
+        cache.locate(point)
+
+    graph.insert_many(removed_segments)
+
+    assert [cache.locate(point) for point in points] == graph.locate_many(
+            points
+    )
+
+
+@given(strategies.contexts, strategies.multisegments_with_points_lists)
+def test_locate_many(context: Context,
+                     multisegment_with_points: Tuple[Multisegment,
+                                                     List[Point]]) -> None:
+    multisegment, points = multisegment_with_points
+
+    result = Graph.from_multisegment(multisegment,
+                                     context=context)
+
+    assert result.locate_many(points) == [result.locate(point)
+                                          for point in points]
+
+
+@given(strategies.contexts, strategies.multisegments_with_points_lists)
+def test_pickling(context: Context,
+                  multisegment_with_points: Tuple[Multisegment,
+                                                  List[Point]]) -> None:
+    multisegment, points = multisegment_with_points
+    graph = Graph.from_multisegment(multisegment,
+                                    context=context)
+
+    result = pickle.loads(pickle.dumps(graph))
+
+    assert isinstance(result, Graph)
+    assert result.rebuilds_count == graph.rebuilds_count
+    assert result.depth_stats() == graph.depth_stats()
+    assert result.locate_many(points) == graph.locate_many(points)
+
+
+@given(strategies.contexts, strategies.multisegments_with_points_lists)
+def test_remove(context: Context,
+                multisegment_with_points: Tuple[Multisegment, List[Point]]
+                ) -> None:
+    multisegment, points = multisegment_with_points
+    graph = Graph.from_multisegment(multisegment,
+                                    context=context)
+    removed_segments = multisegment.segments[::2]
+    rest_multisegment = MultisegmentCls(multisegment.segments[1::2])
+
+    graph.remove_many(removed_segments)
+
+    assert graph.locate_many(points) == [
+        point_in_multisegment(point, rest_multisegment)
+        for point in points
+    ]
+
+    graph.insert_many(removed_segments)
+
+    assert graph.locate_many(points) == [
+        point_in_multisegment(point, multisegment) for point in points
+    ]
+
+
+@given(strategies.contexts, strategies.multisegments_with_points_lists)
+def test_remove_lazily(context: Context,
+                       multisegment_with_points: Tuple[Multisegment,
+                                                       List[Point]]) -> None:
+    multisegment, points = multisegment_with_points
+    graph = Graph.from_multisegment(multisegment,
+                                    context=context)
+    removed_segment, *rest_segments = multisegment.segments
+    points = points + [
+        point
+        for segment in multisegment.segments
+        for point in (segment.start, segment.end,
+                      context.segment_centroid(segment))
+    ]
+
+    graph.remove(removed_segment)
+
+    root = graph.root
+    expected_locations = [
+        point_in_multisegment(point, MultisegmentCls(rest_segments))
+        if rest_segments
+        else Location.EXTERIOR
+        for point in points
+    ]
+    assert graph.locate_many(points) == expected_locations
+    assert [graph.locate(point) for point in points] == expected_locations
+    assert graph.freeze().locate_many(points) == expected_locations
+    assert (pickle.loads(pickle.dumps(graph)).locate_many(points)
+            == expected_locations)
+    assert all(isinstance(trapezoid, Trapezoid)
+               for trapezoid in graph.trapezoids())
+    assert graph.root is root
+
+    graph.insert(removed_segment)
+
+    assert graph.locate_many(points) == [
+        point_in_multisegment(point, multisegment) for point in points
+    ]
+
+
+@given(strategies.contexts, strategies.multisegments)
+def test_trapezoids(context: Context, multisegment: Multisegment) -> None:
+    graph = Graph.from_multisegment(multisegment,
+                                    context=context)
+
+    result = list(graph.trapezoids())
+
+    edges_count = len(multisegment.segments)
+    assert all(isinstance(trapezoid, Trapezoid) for trapezoid in result)
+    assert len(set(map(id, result))) == len(result)
+    assert len(result) == graph.depth_stats().leaves_count
+    assert len(result) <= 3 * edges_count + 1
+    assert ([trapezoid for trapezoid in result if trapezoid.component]
+            == list(graph.trapezoids(components_only=True)))
@@ -1,12 +1,26 @@
-from typing import Tuple
+import pickle
+from math import log2
+from typing import (List,
+                    Tuple)
 
 from ground.base import (Context,
-                         Location)
-from ground.hints import Point
+                         Location,
+                         Relation)
+from ground.hints import (Point,
+                          Segment)
 from hypothesis import given
-from orient.planar import point_in_polygon
+from orient.planar import (point_in_polygon,
+                           point_in_segment,
+                           segment_in_polygon)
 
-from sect.decomposition import Graph
+from sect.decomposition import (BrioShuffler,
+                                DepthStats,
+                                FrozenGraph,
+                                Graph,
+                                LocalityCache,
+                                PermutationShuffler,
+                                Trapezoid,
+                                locate_parallel)
 from tests.utils import Polygon
 from . import strategies
 
@@ -32,6 +46,24 @@ def test_height(context: Context,
                                           for hole in polygon.holes))
 
 
+@given(strategies.contexts, strategies.polygons_with_points_lists,
+       strategies.seeds)
+def test_brio_shuffler(context: Context,
+                       polygon_with_points: Tuple[Polygon, List[Point]],
+                       seed: int) -> None:
+    polygon, points = polygon_with_points
+
+    result = Graph.from_polygon(polygon,
+                                shuffler=BrioShuffler(seed=seed),
+                                context=context)
+
+    edges_count = (len(polygon.border.vertices)
+                   + sum(len(hole.vertices) for hole in polygon.holes))
+    assert sorted(result.permutation) == list(range(edges_count))
+    assert result.locate_many(points) == [point_in_polygon(point, polygon)
+                                          for point in points]
+
+
 @given(strategies.contexts, strategies.polygons_with_points)
 def test_contains(context: Context,
                   polygon_with_point: Tuple[Polygon, Point]) -> None:
@@ -44,6 +76,129 @@ def test_contains(context: Context,
             is (point_in_polygon(point, polygon) is not Location.EXTERIOR))
 
 
+@given(strategies.contexts, strategies.polygons_with_points_lists)
+def test_contains_many(context: Context,
+                       polygon_with_points: Tuple[Polygon, List[Point]]
+                       ) -> None:
+    polygon, points = polygon_with_points
+
+    result = Graph.from_polygon(polygon,
+                                context=context)
+
+    assert result.contains_many(points) == [point in result
+                                            for point in points]
+
+
+@given(strategies.contexts, strategies.polygons)
+def test_depth_stats(context: Context, polygon: Polygon) -> None:
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+
+    result = graph.depth_stats()
+
+    assert isinstance(result, DepthStats)
+    assert result.height == graph.height
+    assert 0 < result.min_leaf_depth <= result.mean_leaf_depth <= result.height
+    assert 0 < result.leaves_count < result.nodes_count
+
+
+@given(strategies.contexts, strategies.polygons_with_points)
+def test_find_trapezoid(context: Context,
+                        polygon_with_point: Tuple[Polygon, Point]) -> None:
+    polygon, point = polygon_with_point
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+
+    result = graph.find_trapezoid(point)
+
+    assert (result is None) is (graph.locate(point) is Location.BOUNDARY)
+    assert result is None or isinstance(result, Trapezoid)
+    assert (result is None
+            or (result.component
+                is (graph.locate(point) is Location.INTERIOR)))
+
+
+@given(strategies.contexts, strategies.polygons_with_points)
+def test_freeze(context: Context,
+                polygon_with_point: Tuple[Polygon, Point]) -> None:
+    polygon, point = polygon_with_point
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+
+    result = graph.freeze()
+
+    assert isinstance(result, FrozenGraph)
+    assert result.height == graph.height
+    assert result.locate(point) is graph.locate(point)
+    assert (point in result) is (point in graph)
+
+
+@given(strategies.contexts, strategies.polygons_with_segments_and_points_lists)
+def test_insert(context: Context,
+                polygon_with_segment_and_points: Tuple[Polygon, Segment,
+                                                       List[Point]]) -> None:
+    polygon, segment, points = polygon_with_segment_and_points
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+
+    try:
+        graph.insert(segment)
+    except ValueError:
+        inserted = False
+    else:
+        inserted = True
+
+    assert (not inserted
+            or segment_in_polygon(segment, polygon) in (Relation.DISJOINT,
+                                                        Relation.TOUCH))
+    assert graph.locate_many(points) == [
+        Location.BOUNDARY
+        if inserted and point_in_segment(point, segment) is Location.BOUNDARY
+        else point_in_polygon(point, polygon)
+        for point in points
+    ]
+
+
+@given(strategies.contexts, strategies.polygons_with_segments_and_points_lists)
+def test_remove_lazily(context: Context,
+                       polygon_with_segment_and_points: Tuple[Polygon,
+                                                              Segment,
+                                                              List[Point]]
+                       ) -> None:
+    polygon, segment, points = polygon_with_segment_and_points
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+    try:
+        graph.insert(segment)
+    except ValueError:
+        return
+
+    graph.remove(segment)
+
+    expected_locations = [point_in_polygon(point, polygon)
+                          for point in points]
+    assert graph.locate_many(points) == expected_locations
+    assert graph.freeze().locate_many(points) == expected_locations
+    assert (pickle.loads(pickle.dumps(graph)).locate_many(points)
+            == expected_locations)
+
+
+@given(strategies.contexts, strategies.polygons)
+def test_max_height_factor(context: Context, polygon: Polygon) -> None:
+    max_height_factor, max_rebuilds_count = 4, 3
+
+    result = Graph.from_polygon(polygon,
+                                max_height_factor=max_height_factor,
+                                max_rebuilds_count=max_rebuilds_count,
+                                context=context)
+
+    edges_count = (len(polygon.border.vertices)
+                   + sum(len(hole.vertices) for hole in polygon.holes))
+    assert 0 <= result.rebuilds_count <= max_rebuilds_count
+    assert (result.rebuilds_count == max_rebuilds_count
+            or result.height <= max_height_factor * log2(edges_count + 1))
+
+
 @given(strategies.contexts, strategies.polygons_with_points)
 def test_locate(context: Context,
                 polygon_with_point: Tuple[Polygon, Point]) -> None:
@@ -53,3 +208,155 @@ def test_locate(context: Context,
                                 context=context)
 
     assert result.locate(point) is point_in_polygon(point, polygon)
+
+
+@given(strategies.contexts, strategies.polygons_with_points_lists)
+def test_locate_array(context: Context,
+                      polygon_with_points: Tuple[Polygon, List[Point]]
+                      ) -> None:
+    polygon, points = polygon_with_points
+    points = points + polygon.border.vertices
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+    frozen_graph = graph.freeze()
+    xs, ys = ([float(point.x) for point in points],
+              [float(point.y) for point in points])
+
+    result = frozen_graph.locate_array(xs, ys)
+
+    assert result == [graph.locate(context.point_cls(x, y))
+                      for x, y in zip(xs, ys)]
+
+
+@given(strategies.contexts, strategies.polygons_with_points_lists)
+def test_locality_cache(context: Context,
+                        polygon_with_points: Tuple[Polygon, List[Point]]
+                        ) -> None:
+    polygon, points = polygon_with_points
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+    cache = LocalityCache(graph)
+    points = sorted(points)
+
+    result = [cache.locate(point) for point in points]
+
+    assert result == graph.locate_many(points)
+    assert cache.hits + cache.misses == len(points)
+
+
+@given(strategies.contexts, strategies.polygons_with_points_lists)
+def test_locate_many(context: Context,
+                     polygon_with_points: Tuple[Polygon, List[Point]]
+                     ) -> None:
+    polygon, points = polygon_with_points
+
+    result = Graph.from_polygon(polygon,
+                                context=context)
+
+    assert result.locate_many(points) == [result.locate(point)
+                                          for point in points]
+
+
+@given(strategies.contexts, strategies.polygons_with_points_lists)
+def test_locate_stream(context: Context,
+                       polygon_with_points: Tuple[Polygon, List[Point]]
+                       ) -> None:
+    polygon, points = polygon_with_points
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+
+    result = graph.locate_stream(iter(points),
+                                 chunk_size=3)
+
+    assert list(result) == graph.locate_many(points)
+
+
+@given(strategies.contexts, strategies.polygons_with_points_lists)
+def test_locate_parallel(context: Context,
+                         polygon_with_points: Tuple[Polygon, List[Point]]
+                         ) -> None:
+    polygon, points = polygon_with_points
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+
+    result = locate_parallel(graph, points,
+                             workers=2)
+
+    assert result == graph.locate_many(points)
+
+
+@given(strategies.contexts, strategies.polygons)
+def test_permutation(context: Context, polygon: Polygon) -> None:
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+
+    result = Graph.from_polygon(
+            polygon,
+            shuffler=PermutationShuffler(graph.permutation),
+            context=context
+    )
+
+    edges_count = (len(polygon.border.vertices)
+                   + sum(len(hole.vertices) for hole in polygon.holes))
+    assert sorted(graph.permutation) == list(range(edges_count))
+    assert result.permutation == graph.permutation
+    assert result.depth_stats() == graph.depth_stats()
+
+
+@given(strategies.contexts, strategies.polygons_with_points_lists)
+def test_pickling(context: Context,
+                  polygon_with_points: Tuple[Polygon, List[Point]]) -> None:
+    polygon, points = polygon_with_points
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+
+    result = pickle.loads(pickle.dumps(graph))
+
+    assert isinstance(result, Graph)
+    assert result.rebuilds_count == graph.rebuilds_count
+    assert result.permutation == graph.permutation
+    assert result.depth_stats() == graph.depth_stats()
+    assert result.locate_many(points) == graph.locate_many(points)
+
+
+@given(strategies.contexts, strategies.polygons)
+def test_trapezoids(context: Context, polygon: Polygon) -> None:
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+
+    result = list(graph.trapezoids())
+
+    edges_count = (len(polygon.border.vertices)
+                   + sum(len(hole.vertices) for hole in polygon.holes))
+    assert all(isinstance(trapezoid, Trapezoid) for trapezoid in result)
+    assert len(set(map(id, result))) == len(result)
+    assert len(result) == graph.depth_stats().leaves_count
+    assert len(result) <= 3 * edges_count + 1
+    assert ([trapezoid for trapezoid in result if trapezoid.component]
+            == list(graph.trapezoids(components_only=True)))
+
+
+@given(strategies.contexts, strategies.polygons_with_segments)
+def test_relate_segment(context: Context,
+                        polygon_with_segment: Tuple[Polygon, Segment]) -> None:
+    polygon, segment = polygon_with_segment
+    graph = Graph.from_polygon(polygon,
+                               context=context)
+
+    result = graph.relate_segment(segment)
+
+    assert result is segment_in_polygon(segment, polygon)
+
+
+@given(strategies.contexts, strategies.polygons, strategies.seeds)
+def test_seed(context: Context, polygon: Polygon, seed: int) -> None:
+    graph = Graph.from_polygon(polygon,
+                               seed=seed,
+                               context=context)
+
+    result = Graph.from_polygon(polygon,
+                                seed=seed,
+                                context=context)
+
+    assert result.permutation == graph.permutation
+    assert result.depth_stats() == graph.depth_stats()
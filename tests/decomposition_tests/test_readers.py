@@ -0,0 +1,47 @@
+import csv
+import io
+from typing import (List,
+                    Tuple)
+
+from ground.base import (Context,
+                         get_context)
+from hypothesis import (given,
+                        strategies)
+
+from sect.core.trapezoidal.readers import BINARY_POINT_FORMAT
+from sect.decomposition import (read_binary_points,
+                                read_csv_points)
+
+contexts = strategies.just(get_context())
+floats = strategies.floats(allow_nan=False,
+                           allow_infinity=False)
+coordinates_pairs_lists = strategies.lists(strategies.tuples(floats, floats))
+
+
+@given(contexts, coordinates_pairs_lists, strategies.integers(1, 10))
+def test_read_binary_points(context: Context,
+                            coordinates_pairs: List[Tuple[float, float]],
+                            chunk_size: int) -> None:
+    file = io.BytesIO(b''.join(BINARY_POINT_FORMAT.pack(x, y)
+                               for x, y in coordinates_pairs))
+
+    result = read_binary_points(file,
+                                chunk_size=chunk_size,
+                                context=context)
+
+    assert list(result) == [context.point_cls(x, y)
+                            for x, y in coordinates_pairs]
+
+
+@given(contexts, coordinates_pairs_lists)
+def test_read_csv_points(context: Context,
+                         coordinates_pairs: List[Tuple[float, float]]) -> None:
+    file = io.StringIO()
+    csv.writer(file).writerows(coordinates_pairs)
+    file.seek(0)
+
+    result = read_csv_points(file,
+                             context=context)
+
+    assert list(result) == [context.point_cls(x, y)
+                            for x, y in coordinates_pairs]
@@ -52,6 +52,76 @@ def test_sizes(context: Context,
     assert all(is_contour_triangular(triangle) for triangle in triangles)
 
 
+@given(strategies.contexts, strategies.polygons_with_extra_points)
+def test_compact(context: Context,
+                 polygon_with_extra_points: Tuple[Polygon, Sequence[Point]]
+                 ) -> None:
+    polygon, extra_points = polygon_with_extra_points
+
+    result = Triangulation.constrained_delaunay(polygon,
+                                                extra_points=extra_points,
+                                                compact=True,
+                                                context=context)
+
+    triangles = result.triangles()
+    expected_triangles = Triangulation.constrained_delaunay(
+            polygon,
+            extra_points=extra_points,
+            context=context
+    ).triangles()
+    assert len(triangles) == len(expected_triangles)
+    assert all(triangle in expected_triangles for triangle in triangles)
+
+
+@given(strategies.contexts, strategies.polygons_with_extra_points)
+def test_filtered(context: Context,
+                  polygon_with_extra_points: Tuple[Polygon, Sequence[Point]]
+                  ) -> None:
+    polygon, extra_points = polygon_with_extra_points
+
+    result = Triangulation.constrained_delaunay(polygon,
+                                                extra_points=extra_points,
+                                                filtered=True,
+                                                context=context)
+
+    triangles = result.triangles()
+    expected_triangles = Triangulation.constrained_delaunay(
+            polygon,
+            extra_points=extra_points,
+            context=context
+    ).triangles()
+    assert len(triangles) == len(expected_triangles)
+    assert all(triangle in expected_triangles for triangle in triangles)
+    assert result.context is context
+
+
+@given(strategies.contexts, strategies.polygons_with_extra_points)
+def test_triangles_indices(
+        context: Context,
+        polygon_with_extra_points: Tuple[Polygon, Sequence[Point]]
+) -> None:
+    polygon, extra_points = polygon_with_extra_points
+    triangulation = Triangulation.constrained_delaunay(
+            polygon,
+            extra_points=extra_points,
+            context=context
+    )
+
+    vertices, indices = triangulation.triangles_indices()
+
+    triangles = triangulation.triangles()
+    passed_points = list(chain(polygon.border.vertices,
+                               flatten(hole.vertices
+                                       for hole in polygon.holes),
+                               extra_points))
+    assert vertices[:len(passed_points)] == passed_points
+    assert len(indices) == 3 * len(triangles)
+    assert all(context.contour_cls([vertices[index]
+                                    for index in indices[offset:offset + 3]])
+               in triangles
+               for offset in range(0, len(indices), 3))
+
+
 @given(strategies.contexts, strategies.polygons_with_extra_points)
 def test_points(context: Context,
                 polygon_with_extra_points: Tuple[Polygon, Sequence[Point]]
@@ -35,6 +35,81 @@ def test_sizes(context: Context, points: Sequence[Point]) -> None:
     assert all(is_contour_triangular(triangle) for triangle in triangles)
 
 
+@given(strategies.contexts, strategies.points_lists)
+def test_compact(context: Context, points: Sequence[Point]) -> None:
+    result = Triangulation.delaunay(points,
+                                    compact=True,
+                                    context=context)
+
+    triangles = result.triangles()
+    expected_triangles = Triangulation.delaunay(points,
+                                                context=context).triangles()
+    assert len(triangles) == len(expected_triangles)
+    assert all(triangle in expected_triangles for triangle in triangles)
+
+
+@given(strategies.contexts, strategies.points_lists)
+def test_filtered(context: Context, points: Sequence[Point]) -> None:
+    result = Triangulation.delaunay(points,
+                                    filtered=True,
+                                    context=context)
+
+    triangles = result.triangles()
+    expected_triangles = Triangulation.delaunay(points,
+                                                context=context).triangles()
+    assert len(triangles) == len(expected_triangles)
+    assert all(triangle in expected_triangles for triangle in triangles)
+    assert result.context is context
+
+
+@given(strategies.contexts, strategies.points_lists)
+def test_workers(context: Context, points: Sequence[Point]) -> None:
+    result = Triangulation.delaunay(points,
+                                    workers=2,
+                                    context=context)
+
+    triangles = result.triangles()
+    expected_triangles = Triangulation.delaunay(points,
+                                                context=context).triangles()
+    assert len(triangles) == len(expected_triangles)
+    assert all(triangle in expected_triangles for triangle in triangles)
+
+
+@given(strategies.contexts, strategies.points_lists)
+def test_iter_triangles(context: Context, points: Sequence[Point]) -> None:
+    triangulation = Triangulation.delaunay(points,
+                                           context=context)
+
+    result = triangulation.iter_triangles()
+
+    triangles = list(result)
+    assert iter(result) is result
+    assert len(triangles) == len(to_distinct(frozenset(triangle.vertices)
+                                             for triangle in triangles))
+    assert all(normalize_contour(triangle) == triangle
+               for triangle in triangles)
+
+
+@given(strategies.contexts, strategies.points_lists)
+def test_triangles_indices(context: Context,
+                           points: Sequence[Point]) -> None:
+    points = list(points)
+    triangulation = Triangulation.delaunay(points,
+                                           context=context)
+    points_copy = points[:]
+    points.clear()
+
+    vertices, indices = triangulation.triangles_indices()
+
+    triangles = triangulation.triangles()
+    assert vertices[:len(points_copy)] == points_copy
+    assert len(indices) == 3 * len(triangles)
+    assert all(context.contour_cls([vertices[index]
+                                    for index in indices[offset:offset + 3]])
+               in triangles
+               for offset in range(0, len(indices), 3))
+
+
 @given(strategies.contexts, strategies.points_lists)
 def test_delaunay_criterion(context: Context, points: Sequence[Point]) -> None:
     result = Triangulation.delaunay(points,
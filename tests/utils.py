@@ -25,6 +25,7 @@ Strategy = SearchStrategy
 context = get_context()
 Contour = context.contour_cls
 Multipoint = context.multipoint_cls
+Multipolygon = context.multipolygon_cls
 Multisegment = context.multisegment_cls
 Point = context.point_cls
 Polygon = context.polygon_cls